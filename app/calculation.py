@@ -1,5 +1,6 @@
 """Calculation data model."""
 
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -7,6 +8,10 @@ from typing import Optional
 class Calculation:
     """Represents a single calculation operation."""
     
+    __slots__ = (
+        'operation', 'operand_a', 'operand_b', 'result', '_ts', '_str_cache'
+    )
+    
     def __init__(
         self,
         operation: str,
@@ -29,14 +34,29 @@ class Calculation:
         self.operand_a = operand_a
         self.operand_b = operand_b
         self.result = result
-        self.timestamp = timestamp or datetime.now()
+        # Stored as epoch seconds; datetime objects are built on demand
+        self._ts = time.time() if timestamp is None else timestamp.timestamp()
+        self._str_cache: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Timestamp of the calculation."""
+        return datetime.fromtimestamp(self._ts)
+    
+    @property
+    def epoch(self) -> float:
+        """Timestamp of the calculation in seconds since the epoch."""
+        return self._ts
     
     def __str__(self) -> str:
         """String representation of the calculation."""
-        return (
-            f"{self.operation}({self.operand_a}, {self.operand_b}) = "
-            f"{self.result}"
-        )
+        # Calculations are not modified after creation, so format once
+        if self._str_cache is None:
+            self._str_cache = (
+                f"{self.operation}({self.operand_a}, {self.operand_b}) = "
+                f"{self.result}"
+            )
+        return self._str_cache
     
     def __repr__(self) -> str:
         """Detailed representation of the calculation."""
@@ -56,6 +76,25 @@ class Calculation:
             'timestamp': self.timestamp.isoformat()
         }
     
+    @classmethod
+    def from_epoch(
+        cls,
+        operation: str,
+        operand_a: float,
+        operand_b: float,
+        result: float,
+        epoch: float
+    ) -> 'Calculation':
+        """Create Calculation from an epoch-seconds timestamp."""
+        calc = cls.__new__(cls)
+        calc.operation = operation
+        calc.operand_a = operand_a
+        calc.operand_b = operand_b
+        calc.result = result
+        calc._ts = epoch
+        calc._str_cache = None
+        return calc
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'Calculation':
         """Create Calculation from dictionary (CSV deserialization)."""
@@ -1,21 +1,46 @@
 """Main Calculator class with REPL interface and Decorator Pattern for help."""
 
+import atexit
 import sys
 from typing import Optional
-from colorama import init, Fore, Style
 from app.calculator_config import CalculatorConfig
 from app.input_validators import InputValidator
-from app.operations import OperationFactory
+from app.operations import OPERATIONS, OperationFactory
 from app.calculation import Calculation
 from app.history import HistoryManager
 from app.calculator_memento import CalculatorOriginator, CalculatorCaretaker
-from app.observers import LoggingObserver, AutoSaveObserver
+from app.observers import (
+    CalculatorObserver,
+    LoggingObserver,
+    AutoSaveObserver
+)
 from app.exceptions import OperationError, ValidationError
 from app.logger import Logger
 
+try:
+    from colorama import init, Fore, Style
+except ImportError:  # pragma: no cover
+    class _NoColor:
+        """Stand-in for colorama constants that renders without color."""
+        
+        def __getattr__(self, name: str) -> str:
+            return ''
+    
+    Fore = Style = _NoColor()
+    
+    def init(*args, **kwargs):
+        """No-op replacement for colorama.init."""
+
 # Initialize colorama
 init(autoreset=True)
 
+# Color-prefixed response fragments, built once instead of per command
+_GREEN_RESULT = f"{Fore.GREEN}Result: "
+_RED_ERR = f"{Fore.RED}Error: "
+_UNKNOWN_CMD_MSG = (
+    f"{Fore.RED}Unknown command: {{}}. Type 'help' for available commands."
+)
+
 
 def help_decorator(func):
     """Decorator to register commands for dynamic help menu."""
@@ -27,6 +52,53 @@ def help_decorator(func):
     return func
 
 
+# Two-operand commands mapped to their help text
+BINARY_COMMANDS = {
+    'add': "Add two numbers. Usage: add <a> <b>",
+    'subtract': "Subtract b from a. Usage: subtract <a> <b>",
+    'multiply': "Multiply two numbers. Usage: multiply <a> <b>",
+    'divide': "Divide a by b. Usage: divide <a> <b>",
+    'power': "Raise a to the power of b. Usage: power <a> <b>",
+    'root': "Calculate the bth root of a. Usage: root <a> <b>",
+    'modulus': "Compute a modulo b. Usage: modulus <a> <b>",
+    'int_divide': "Integer division of a by b. Usage: int_divide <a> <b>",
+    'percent': "Calculate (a/b)*100. Usage: percent <a> <b>",
+    'abs_diff': "Absolute difference between a and b. Usage: abs_diff <a> <b>",
+}
+
+# Number of arguments taken by each command that accepts arguments
+_CMD_ARITY = {name: 2 for name in BINARY_COMMANDS}
+
+_ARG_ERRORS = {
+    name: f"{_RED_ERR}{name} requires {arity} arguments"
+    for name, arity in _CMD_ARITY.items()
+}
+
+
+def _make_binary_cmd(op_name: str, description: str):
+    """
+    Build the REPL handler for a two-operand operation.
+    
+    Args:
+        op_name: Name of the operation the handler performs
+        description: Help text registered for the command
+        
+    Returns:
+        Command method registered with help_decorator
+    """
+    def command(self, args: list[str]) -> str:
+        # Argument count is checked by _process_command
+        try:
+            result = self._perform_calculation(op_name, args[0], args[1])
+            return f"{_GREEN_RESULT}{result}"
+        except (OperationError, ValidationError) as e:
+            return f"{_RED_ERR}{e}"
+    
+    command.__name__ = f"_cmd_{op_name}"
+    command.__doc__ = description
+    return help_decorator(command)
+
+
 class Calculator:
     """Enhanced calculator with REPL interface."""
     
@@ -39,31 +111,69 @@ class Calculator:
         
         # Memento Pattern for undo/redo
         self.originator = CalculatorOriginator()
-        self.caretaker = CalculatorCaretaker(self.originator)
+        self.caretaker = CalculatorCaretaker(
+            self.originator,
+            max_states=self.config.max_history_size
+        )
         
         # Observer Pattern
-        self.observers = []
+        self._observers: tuple[CalculatorObserver, ...] = ()
         self._register_observers()
         
+        # Command name -> bound handler, resolved once instead of per line
+        self._cmd_dispatch = {
+            name: getattr(self, f"_cmd_{name}")
+            for name in help_decorator.commands
+        }
+        
         # Load history from CSV if available
         try:
             self.history_manager.load_from_csv()
-            self.originator.set_history(self.history_manager.get_history())
+            self.originator.set_history(self.history_manager.history_view())
         except Exception as e:
             self.logger.log_warning(f"Could not load history: {e}")
     
     def _register_observers(self):
         """Register observers."""
-        logging_observer = LoggingObserver()
-        auto_save_observer = AutoSaveObserver(self.history_manager)
-        
-        self.observers.append(logging_observer)
+        self.add_observer(LoggingObserver())
+        self._auto_save_observer: Optional[AutoSaveObserver] = None
         if self.config.auto_save:
-            self.observers.append(auto_save_observer)
+            self._auto_save_observer = AutoSaveObserver(self.history_manager)
+            self.add_observer(self._auto_save_observer)
+            # Fallback for sessions that end without close(); saving
+            # during interpreter shutdown is not reliable
+            atexit.register(self.close)
+    
+    def close(self):
+        """
+        Stop background auto-saving and save any unsaved calculations.
+        
+        Called by run() when the session ends; calling it again does
+        nothing.
+        """
+        observer = self._auto_save_observer
+        if observer is None:
+            return
+        self._auto_save_observer = None
+        atexit.unregister(self.close)
+        self._observers = tuple(o for o in self._observers if o is not observer)
+        observer.stop()
+    
+    def add_observer(self, observer: CalculatorObserver):
+        """
+        Register an observer.
+        
+        The observer tuple is replaced rather than mutated, so
+        notification can iterate it without copying.
+        
+        Args:
+            observer: Observer to notify of new calculations
+        """
+        self._observers = self._observers + (observer,)
     
     def _notify_observers(self, calculation: Calculation):
         """Notify all observers of a new calculation."""
-        for observer in self.observers:
+        for observer in self._observers:
             observer.on_calculation(calculation)
     
     def _perform_calculation(
@@ -86,12 +196,15 @@ class Calculator:
         # Validate inputs
         a, b = self.validator.validate_two_numbers(a_str, b_str)
         
-        # Create operation
-        operation = OperationFactory.create_operation(operation_name)
+        # Look up the operation function; the factory handles other
+        # spellings and raises for unknown names
+        operation = OPERATIONS.get(operation_name)
+        if operation is None:
+            operation = OperationFactory.create_operation(operation_name).execute
         
         # Execute operation
         try:
-            result = operation.execute(a, b)
+            result = operation(a, b)
             # Round result based on precision
             result = round(result, self.config.precision)
         except OperationError as e:
@@ -118,120 +231,10 @@ class Calculator:
         
         return result
     
-    @help_decorator
-    def _cmd_add(self, args: list[str]) -> str:
-        """Add two numbers. Usage: add <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: add requires 2 arguments"
-        try:
-            result = self._perform_calculation('add', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_subtract(self, args: list[str]) -> str:
-        """Subtract b from a. Usage: subtract <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: subtract requires 2 arguments"
-        try:
-            result = self._perform_calculation('subtract', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_multiply(self, args: list[str]) -> str:
-        """Multiply two numbers. Usage: multiply <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: multiply requires 2 arguments"
-        try:
-            result = self._perform_calculation('multiply', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_divide(self, args: list[str]) -> str:
-        """Divide a by b. Usage: divide <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: divide requires 2 arguments"
-        try:
-            result = self._perform_calculation('divide', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_power(self, args: list[str]) -> str:
-        """Raise a to the power of b. Usage: power <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: power requires 2 arguments"
-        try:
-            result = self._perform_calculation('power', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_root(self, args: list[str]) -> str:
-        """Calculate the bth root of a. Usage: root <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: root requires 2 arguments"
-        try:
-            result = self._perform_calculation('root', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_modulus(self, args: list[str]) -> str:
-        """Compute a modulo b. Usage: modulus <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: modulus requires 2 arguments"
-        try:
-            result = self._perform_calculation('modulus', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_int_divide(self, args: list[str]) -> str:
-        """Integer division of a by b. Usage: int_divide <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: int_divide requires 2 arguments"
-        try:
-            result = self._perform_calculation('int_divide', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_percent(self, args: list[str]) -> str:
-        """Calculate (a/b)*100. Usage: percent <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: percent requires 2 arguments"
-        try:
-            result = self._perform_calculation('percent', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
-    @help_decorator
-    def _cmd_abs_diff(self, args: list[str]) -> str:
-        """Absolute difference between a and b. Usage: abs_diff <a> <b>"""
-        if len(args) != 2:
-            return Fore.RED + "Error: abs_diff requires 2 arguments"
-        try:
-            result = self._perform_calculation('abs_diff', args[0], args[1])
-            return f"{Fore.GREEN}Result: {result}"
-        except (OperationError, ValidationError) as e:
-            return f"{Fore.RED}Error: {e}"
-    
     @help_decorator
     def _cmd_history(self, args: list[str]) -> str:
         """Display calculation history. Usage: history"""
-        history = self.history_manager.get_history()
+        history = self.history_manager.history_view()
         if not history:
             return Fore.YELLOW + "No calculations in history."
         
@@ -286,7 +289,7 @@ class Calculator:
         """Load calculation history from CSV. Usage: load"""
         try:
             if self.history_manager.load_from_csv():
-                self.originator.set_history(self.history_manager.get_history())
+                self.originator.set_history(self.history_manager.history_view())
                 return Fore.GREEN + f"History loaded from {self.config.history_file}"
             return Fore.YELLOW + "No history file found."
         except Exception as e:
@@ -324,16 +327,23 @@ class Calculator:
         if not command:
             return None
         
-        parts = command.split()
+        # Split off the command name at the first run of whitespace
+        parts = command.split(None, 1)
         cmd_name = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
         
         # Map command to method
-        method_name = f"_cmd_{cmd_name}"
-        if not hasattr(self, method_name):
-            return f"{Fore.RED}Unknown command: {cmd_name}. Type 'help' for available commands."
+        method = self._cmd_dispatch.get(cmd_name)
+        if method is None:
+            return _UNKNOWN_CMD_MSG.format(cmd_name)
+        
+        # Only commands that take arguments are tokenized and checked
+        arity = _CMD_ARITY.get(cmd_name)
+        if arity is None:
+            return method([])
         
-        method = getattr(self, method_name)
+        args = parts[1].split() if len(parts) > 1 else []
+        if len(args) != arity:
+            return _ARG_ERRORS[cmd_name]
         return method(args)
     
     def run(self):
@@ -341,25 +351,37 @@ class Calculator:
         print(f"{Fore.CYAN}{Style.BRIGHT}Enhanced Calculator")
         print(f"{Fore.WHITE}Type 'help' for available commands or 'exit' to quit.\n")
         
-        while True:
-            try:
-                command = input(f"{Fore.GREEN}> ")
-                result = self._process_command(command)
-                
-                if result == "EXIT":
-                    print(f"{Fore.YELLOW}Goodbye!")
+        try:
+            while True:
+                try:
+                    command = input(f"{Fore.GREEN}> ")
+                    result = self._process_command(command)
+                    
+                    if result == "EXIT":
+                        print(f"{Fore.YELLOW}Goodbye!")
+                        break
+                    elif result:
+                        print(result)
+                except KeyboardInterrupt:  # pragma: no cover
+                    print(f"\n{Fore.YELLOW}Goodbye!")
+                    break
+                except EOFError:  # pragma: no cover
+                    print(f"\n{Fore.YELLOW}Goodbye!")
                     break
-                elif result:
-                    print(result)
-            except KeyboardInterrupt:  # pragma: no cover
-                print(f"\n{Fore.YELLOW}Goodbye!")
-                break
-            except EOFError:  # pragma: no cover
-                print(f"\n{Fore.YELLOW}Goodbye!")
-                break
-            except Exception as e:  # pragma: no cover
-                print(f"{Fore.RED}Unexpected error: {e}")
-                self.logger.log_error(f"Unexpected error in REPL: {e}")
+                except Exception as e:  # pragma: no cover
+                    print(f"{Fore.RED}Unexpected error: {e}")
+                    self.logger.log_error(f"Unexpected error in REPL: {e}")
+        finally:
+            # Save while the interpreter is still fully running
+            self.close()
+
+
+for _op_name, _description in BINARY_COMMANDS.items():
+    setattr(
+        Calculator,
+        f"_cmd_{_op_name}",
+        _make_binary_cmd(_op_name, _description)
+    )
 
 
 def main():  # pragma: no cover
@@ -1,69 +1,162 @@
 """Configuration management for the calculator application."""
 
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
 from app.exceptions import ConfigurationError
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> Path:
+    """
+    Create a directory if needed, at most once per path per process.
+    
+    Args:
+        path: Directory path
+        
+    Returns:
+        The directory as a Path
+    """
+    directory = Path(path)
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+# Environment variables read by the configuration, with their defaults
+_ENV_DEFAULTS = (
+    ('CALCULATOR_LOG_DIR', 'logs'),
+    ('CALCULATOR_HISTORY_DIR', 'history'),
+    ('CALCULATOR_MAX_HISTORY_SIZE', '100'),
+    ('CALCULATOR_AUTO_SAVE', 'true'),
+    ('CALCULATOR_PRECISION', '10'),
+    ('CALCULATOR_MAX_INPUT_VALUE', '1e308'),
+    ('CALCULATOR_DEFAULT_ENCODING', 'utf-8'),
+    ('CALCULATOR_HISTORY_FORMAT', 'csv'),
+)
+
+# File formats the history can be saved in
+HISTORY_FORMATS = ('csv', 'feather', 'parquet')
+
+
+@dataclass(frozen=True, slots=True)
+class _EnvSettings:
+    """Parsed and validated configuration values."""
+    
+    log_dir: Path
+    history_dir: Path
+    max_history_size: int
+    auto_save: bool
+    precision: int
+    max_input_value: float
+    default_encoding: str
+    history_format: str
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(raw: tuple[str, ...]) -> _EnvSettings:
+    """
+    Parse raw environment values into settings.
+    
+    Results are cached on the raw strings, so unchanged environments
+    are parsed once while changed ones are still picked up.
+    
+    Args:
+        raw: Values of the _ENV_DEFAULTS variables, in order
+        
+    Returns:
+        Parsed settings
+        
+    Raises:
+        ConfigurationError: If a value cannot be parsed
+    """
+    (
+        log_dir,
+        history_dir,
+        max_history_size,
+        auto_save,
+        precision,
+        max_input_value,
+        default_encoding,
+        history_format
+    ) = raw
+    
+    try:
+        max_history_size = int(max_history_size)
+    except ValueError:
+        raise ConfigurationError(
+            "CALCULATOR_MAX_HISTORY_SIZE must be an integer"
+        )
+    
+    try:
+        precision = int(precision)
+    except ValueError:
+        raise ConfigurationError(
+            "CALCULATOR_PRECISION must be an integer"
+        )
+    
+    try:
+        max_input_value = float(max_input_value)
+    except ValueError:
+        raise ConfigurationError(
+            "CALCULATOR_MAX_INPUT_VALUE must be a number"
+        )
+    
+    history_format = history_format.lower()
+    if history_format not in HISTORY_FORMATS:
+        raise ConfigurationError(
+            "CALCULATOR_HISTORY_FORMAT must be one of: "
+            + ', '.join(HISTORY_FORMATS)
+        )
+    
+    return _EnvSettings(
+        log_dir=Path(log_dir),
+        history_dir=Path(history_dir),
+        max_history_size=max_history_size,
+        auto_save=auto_save.lower() in ('true', '1', 'yes'),
+        precision=precision,
+        max_input_value=max_input_value,
+        default_encoding=default_encoding,
+        history_format=history_format
+    )
+
+
 class CalculatorConfig:
     """Manages configuration settings from environment variables."""
     
     def __init__(self):
         """Initialize configuration by loading environment variables."""
-        load_dotenv()
+        # Skip importing and parsing dotenv when there is no .env file
+        env_file = Path('.env')
+        if env_file.is_file():
+            from dotenv import load_dotenv
+            load_dotenv(env_file)
         self._load_config()
     
     def _load_config(self):
         """Load and validate configuration values."""
+        settings = _parse_env(tuple(
+            os.getenv(name, default) for name, default in _ENV_DEFAULTS
+        ))
+        
         # Base directories
-        self.log_dir = Path(
-            os.getenv('CALCULATOR_LOG_DIR', 'logs')
-        )
-        self.history_dir = Path(
-            os.getenv('CALCULATOR_HISTORY_DIR', 'history')
-        )
+        self.log_dir = settings.log_dir
+        self.history_dir = settings.history_dir
         
         # History settings
-        try:
-            self.max_history_size = int(
-                os.getenv('CALCULATOR_MAX_HISTORY_SIZE', '100')
-            )
-        except ValueError:
-            raise ConfigurationError(
-                "CALCULATOR_MAX_HISTORY_SIZE must be an integer"
-            )
-        
-        auto_save = os.getenv('CALCULATOR_AUTO_SAVE', 'true').lower()
-        self.auto_save = auto_save in ('true', '1', 'yes')
+        self.max_history_size = settings.max_history_size
+        self.auto_save = settings.auto_save
+        self.history_format = settings.history_format
         
         # Calculation settings
-        try:
-            self.precision = int(
-                os.getenv('CALCULATOR_PRECISION', '10')
-            )
-        except ValueError:
-            raise ConfigurationError(
-                "CALCULATOR_PRECISION must be an integer"
-            )
-        
-        try:
-            self.max_input_value = float(
-                os.getenv('CALCULATOR_MAX_INPUT_VALUE', '1e308')
-            )
-        except ValueError:
-            raise ConfigurationError(
-                "CALCULATOR_MAX_INPUT_VALUE must be a number"
-            )
-        
-        self.default_encoding = os.getenv(
-            'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
-        )
+        self.precision = settings.precision
+        self.max_input_value = settings.max_input_value
+        self.default_encoding = settings.default_encoding
         
         # File paths
-        self.log_dir.mkdir(exist_ok=True)
-        self.history_dir.mkdir(exist_ok=True)
+        _ensure_dir(os.fspath(self.log_dir))
+        _ensure_dir(os.fspath(self.history_dir))
         
         self.log_file = self.log_dir / 'calculator.log'
-        self.history_file = self.history_dir / 'history.csv'
-
+        self.history_file = self.history_dir / f'history.{self.history_format}'
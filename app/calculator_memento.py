@@ -1,28 +1,34 @@
 """Memento Pattern implementation for undo/redo functionality."""
 
-from typing import Optional
+from collections import deque
+from typing import Optional, Sequence
 from app.calculation import Calculation
 
 
 class CalculatorMemento:
     """Memento class to store calculator state."""
     
-    def __init__(self, history: list[Calculation]):
+    __slots__ = ('history',)
+    
+    def __init__(self, history: Sequence[Calculation]):
         """
         Initialize memento with calculator history.
         
         Args:
-            history: List of calculations representing the state
+            history: Calculations representing the state
         """
-        self.history = history.copy()  # Deep copy to preserve state
+        # Tuples are immutable, so snapshots can share them without copying
+        self.history: tuple[Calculation, ...] = tuple(history)
 
 
 class CalculatorOriginator:
     """Originator class that creates and restores mementos."""
     
+    __slots__ = ('_history',)
+    
     def __init__(self):
         """Initialize the originator."""
-        self._history: list[Calculation] = []
+        self._history: tuple[Calculation, ...] = ()
     
     def save_state(self) -> CalculatorMemento:
         """Create a memento with current state."""
@@ -30,34 +36,42 @@ class CalculatorOriginator:
     
     def restore_state(self, memento: CalculatorMemento):
         """Restore state from a memento."""
-        self._history = memento.history.copy()
+        self._history = memento.history
     
     def add_calculation(self, calculation: Calculation):
         """Add a calculation to history."""
-        self._history.append(calculation)
+        self._history = self._history + (calculation,)
     
-    def get_history(self) -> list[Calculation]:
-        """Get current history."""
-        return self._history.copy()
+    def get_history(self) -> tuple[Calculation, ...]:
+        """Get current history as a read-only snapshot."""
+        return self._history
     
-    def set_history(self, history: list[Calculation]):
+    def set_history(self, history: Sequence[Calculation]):
         """Set the history."""
-        self._history = history.copy()
+        self._history = tuple(history)
 
 
 class CalculatorCaretaker:
     """Caretaker class that manages mementos for undo/redo."""
     
-    def __init__(self, originator: CalculatorOriginator):
+    def __init__(
+        self,
+        originator: CalculatorOriginator,
+        max_states: Optional[int] = None
+    ):
         """
         Initialize caretaker with originator.
         
         Args:
             originator: The originator to manage
+            max_states: Maximum number of states kept on each stack
+                (unbounded if None; negative values keep none)
         """
         self.originator = originator
-        self._undo_stack: list[CalculatorMemento] = []
-        self._redo_stack: list[CalculatorMemento] = []
+        if max_states is not None:
+            max_states = max(max_states, 0)
+        self._undo_stack: deque[CalculatorMemento] = deque(maxlen=max_states)
+        self._redo_stack: deque[CalculatorMemento] = deque(maxlen=max_states)
     
     def save_state(self):
         """Save current state for undo."""
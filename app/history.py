@@ -1,12 +1,30 @@
-"""History management with pandas CSV serialization."""
+"""History management with CSV, Feather and Parquet serialization."""
 
-import pandas as pd
+import codecs
+import csv
+import threading
+import time
+from array import array
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
 from app.exceptions import HistoryError
 
+# pyarrow is an optional fast path for CSV IO. Without it, CSV files are
+# read with the stdlib csv module and fully rewritten with pandas; rows
+# are always appended with the csv module. Feather and Parquet always go
+# through pandas, which needs pyarrow for both.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+CSV_COLUMNS = ('operation', 'operand_a', 'operand_b', 'result', 'timestamp')
+
 
 class HistoryManager:
     """Manages calculation history with CSV persistence."""
@@ -19,7 +37,84 @@ class HistoryManager:
             config: Calculator configuration
         """
         self.config = config
-        self._history: list[Calculation] = []
+        # Guards the columns against auto-save snapshots taken from the
+        # observer's background thread
+        self._lock = threading.Lock()
+        # Serializes reading and writing the history file
+        self._io_lock = threading.Lock()
+        # Incremented on every change, so saves can tell whether history
+        # changed while the file was being written
+        self._version = 0
+        
+        # History is stored column-wise in fixed-capacity ring buffers:
+        # a list of operation names and packed float arrays for the
+        # numbers. Calculation objects are only rebuilt for callers that
+        # ask for them, and once max_history_size rows are stored each
+        # new row overwrites the oldest.
+        self._set_columns([], [], [], [], [])
+    
+    def _mark_file_stale(self):
+        """
+        Record that the history file must be rewritten on the next save.
+        
+        Must be called with the lock held.
+        """
+        self._pending_rows: list[tuple] = []  # rows not yet appended
+        self._file_rows = 0  # rows currently in the history file
+        self._needs_rewrite = True
+        self._version += 1
+    
+    def _mark_file_saved(self):
+        """Record that the history file matches the in-memory history."""
+        with self._lock:
+            self._pending_rows = []
+            self._file_rows = self._size
+            self._needs_rewrite = False
+    
+    def _columns(self) -> tuple:
+        """Get the history columns in CSV column order, oldest row first."""
+        start = self._head
+        end = start + self._size
+        capacity = len(self._operations)
+        columns = (
+            self._operations,
+            self._operands_a,
+            self._operands_b,
+            self._results,
+            self._timestamps
+        )
+        if end <= capacity:
+            return tuple(column[start:end] for column in columns)
+        # The rows wrap around the end of the buffers
+        return tuple(
+            column[start:] + column[:end - capacity] for column in columns
+        )
+    
+    def _set_columns(
+        self,
+        operations: list[str],
+        operands_a: list[float],
+        operands_b: list[float],
+        results: list[float],
+        timestamps: list[float]
+    ):
+        """Replace the history columns, keeping only the newest rows."""
+        capacity = max(self.config.max_history_size, 0)
+        size = min(len(operations), capacity)
+        keep = slice(len(operations) - size, None)
+        # Unused slots are preallocated so adding never resizes a buffer
+        padding = capacity - size
+        zeros = array('d', [0.0]) * padding
+        with self._lock:
+            self._operations = list(operations[keep]) + [''] * padding
+            self._operands_a = array('d', operands_a[keep]) + zeros
+            self._operands_b = array('d', operands_b[keep]) + zeros
+            self._results = array('d', results[keep]) + zeros
+            self._timestamps = array('d', timestamps[keep]) + zeros  # epoch seconds
+            self._head = 0  # index of the oldest row
+            self._size = size
+            self._view: Optional[tuple[Calculation, ...]] = None
+            self._mark_file_stale()
     
     def add_calculation(self, calculation: Calculation):
         """
@@ -28,19 +123,65 @@ class HistoryManager:
         Args:
             calculation: Calculation to add
         """
-        self._history.append(calculation)
-        
-        # Limit history size
-        if len(self._history) > self.config.max_history_size:
-            self._history = self._history[-self.config.max_history_size:]
+        capacity = len(self._operations)
+        if not capacity:
+            return
+        with self._lock:
+            index = (self._head + self._size) % capacity
+            if self._size < capacity:
+                self._size += 1
+            else:
+                # Full: the new row replaces the oldest one
+                self._head = (self._head + 1) % capacity
+            self._operations[index] = calculation.operation
+            self._operands_a[index] = calculation.operand_a
+            self._operands_b[index] = calculation.operand_b
+            self._results[index] = calculation.result
+            self._timestamps[index] = calculation.epoch
+            self._view = None
+            self._version += 1
+            
+            # Remember the row so the next save can append just the new
+            # rows; past max_history_size a rewrite is needed anyway
+            if not self._needs_rewrite:
+                if len(self._pending_rows) < self.config.max_history_size:
+                    self._pending_rows.append((
+                        calculation.operation,
+                        calculation.operand_a,
+                        calculation.operand_b,
+                        calculation.result,
+                        calculation.epoch
+                    ))
+                else:
+                    self._mark_file_stale()
     
     def get_history(self) -> list[Calculation]:
         """Get calculation history."""
-        return self._history.copy()
+        return list(self.history_view())
+    
+    def history_view(self) -> tuple[Calculation, ...]:
+        """
+        Get a read-only view of the calculation history.
+        
+        The view is rebuilt from the columns only after the history
+        changes, so repeated reads share the same Calculation objects.
+        
+        Returns:
+            Tuple of calculations, oldest first
+        """
+        if self._view is None:
+            self._view = tuple(
+                Calculation.from_epoch(*row) for row in zip(*self._columns())
+            )
+        return self._view
     
     def clear_history(self):
         """Clear calculation history."""
-        self._history.clear()
+        with self._lock:
+            self._head = 0
+            self._size = 0
+            self._view = None
+            self._mark_file_stale()
     
     def set_history(self, history: list[Calculation]):
         """
@@ -49,11 +190,29 @@ class HistoryManager:
         Args:
             history: List of calculations
         """
-        self._history = history.copy()
+        self._set_columns(
+            [calc.operation for calc in history],
+            [calc.operand_a for calc in history],
+            [calc.operand_b for calc in history],
+            [calc.result for calc in history],
+            [calc.epoch for calc in history]
+        )
     
     def save_to_csv(self, file_path: Optional[Path] = None) -> bool:
         """
-        Save history to CSV file using pandas.
+        Save history to the history file.
+        
+        The file is written as CSV unless config.history_format selects
+        Feather or Parquet, which need pyarrow. When the CSV history file
+        already holds the earlier history, only calculations added since
+        the last save are appended; the file is rewritten after the
+        history is replaced or cleared, and once appends would grow it
+        past max_history_size rows.
+        
+        Rows always end with a bare LF, but value formatting depends
+        on the writer: pyarrow quotes strings and writes whole numbers
+        without a decimal point, while pandas and appended rows do not.
+        Every row reads back to the same values.
         
         Args:
             file_path: Optional custom file path
@@ -64,31 +223,149 @@ class HistoryManager:
         Raises:
             HistoryError: If save fails
         """
-        if not self._history:
+        if not self._size:
             return True  # Nothing to save
         
-        file_path = file_path or self.config.history_file
-        
-        try:
-            # Convert calculations to list of dictionaries
-            data = [calc.to_dict() for calc in self._history]
+        # One save at a time: the auto-save thread and the save command
+        # must not write the file concurrently
+        with self._io_lock:
+            tracked = file_path is None
+            file_path = file_path or self.config.history_file
+            history_format = self.config.history_format
             
-            # Create DataFrame
-            df = pd.DataFrame(data)
+            if tracked and history_format == 'csv':
+                rows = self._take_pending_rows(file_path)
+                if rows is not None:
+                    return self._append_rows(file_path, rows)
             
-            # Save to CSV
-            df.to_csv(
-                file_path,
-                index=False,
-                encoding=self.config.default_encoding
-            )
+            columns, version = self._snapshot()
+            try:
+                self._write_columns(file_path, history_format, columns)
+            except HistoryError:
+                if tracked:
+                    with self._lock:
+                        self._mark_file_stale()
+                raise
+            if tracked:
+                self._mark_file_written(version, len(columns['operation']))
+            return True
+    
+    def _take_pending_rows(self, file_path: Path) -> Optional[list[tuple]]:
+        """
+        Take the rows to append to the history file.
+        
+        Returns:
+            Rows added since the last save, or None if the file needs
+            to be rewritten instead
+        """
+        with self._lock:
+            if (
+                self._needs_rewrite
+                or self._file_rows + len(self._pending_rows)
+                > self.config.max_history_size
+                or not file_path.exists()
+            ):
+                return None
+            rows, self._pending_rows = self._pending_rows, []
+            self._file_rows += len(rows)
+            return rows
+    
+    def _mark_file_written(self, version: int, row_count: int):
+        """Record a full rewrite of the history file with row_count rows."""
+        with self._lock:
+            if self._version == version:
+                self._pending_rows = []
+                self._file_rows = row_count
+                self._needs_rewrite = False
+            else:
+                # History changed while the file was written, so the
+                # pending rows may already be in it; rewrite it next time
+                self._mark_file_stale()
+    
+    def _append_rows(self, file_path: Path, rows: list[tuple]) -> bool:
+        """Append history rows to an existing CSV history file."""
+        if not rows:
+            return True
+        try:
+            with open(
+                file_path, 'a', newline='', encoding=self.config.default_encoding
+            ) as f:
+                # Match the LF row endings of pandas and pyarrow
+                csv.writer(f, lineterminator='\n').writerows(
+                    (operation, a, b, result,
+                     datetime.fromtimestamp(ts).isoformat())
+                    for operation, a, b, result, ts in rows
+                )
             return True
         except Exception as e:
+            with self._lock:
+                self._mark_file_stale()
             raise HistoryError(f"Failed to save history to CSV: {e}")
     
+    def _write_columns(
+        self, file_path: Path, history_format: str, columns: dict[str, list]
+    ):
+        """Write the whole history to file_path in history_format."""
+        if history_format == 'csv' and pa_csv is not None:
+            try:
+                encoding = codecs.lookup(self.config.default_encoding).name
+            except LookupError as e:
+                raise HistoryError(f"Failed to save history to CSV: {e}")
+            # pyarrow only writes UTF-8, so other encodings go through pandas
+            if encoding == 'utf-8':
+                self._save_with_pyarrow(file_path, columns)
+                return
+        
+        # Imported here so that startup does not pay for pandas
+        import pandas as pd
+        
+        try:
+            # Create DataFrame straight from the history columns
+            df = pd.DataFrame(columns)
+            
+            if history_format == 'csv':
+                df.to_csv(
+                    file_path,
+                    index=False,
+                    encoding=self.config.default_encoding
+                )
+            elif history_format == 'feather':
+                df.to_feather(file_path)
+            else:
+                df.to_parquet(file_path, index=False)
+        except Exception as e:
+            raise HistoryError(
+                f"Failed to save history to {history_format.upper()}: {e}"
+            )
+    
+    def _snapshot(self) -> tuple[dict[str, list], int]:
+        """
+        Get a consistent copy of the history columns.
+        
+        Returns:
+            Columns keyed by CSV column name, and the history version
+            they were copied at
+        """
+        with self._lock:
+            operations, operands_a, operands_b, results, timestamps = (
+                map(list, self._columns())
+            )
+            version = self._version
+        return {
+            'operation': operations,
+            'operand_a': operands_a,
+            'operand_b': operands_b,
+            'result': results,
+            'timestamp': [
+                datetime.fromtimestamp(ts).isoformat() for ts in timestamps
+            ]
+        }, version
+    
     def load_from_csv(self, file_path: Optional[Path] = None) -> bool:
         """
-        Load history from CSV file using pandas.
+        Load history from the history file.
+        
+        The file is read in the format selected by config.history_format.
         
         Args:
             file_path: Optional custom file path
@@ -99,35 +376,170 @@ class HistoryManager:
         Raises:
             HistoryError: If load fails
         """
-        file_path = file_path or self.config.history_file
+        with self._io_lock:
+            tracked = file_path is None
+            file_path = file_path or self.config.history_file
+            
+            if not file_path.exists():
+                return False  # File doesn't exist, not an error
+            
+            history_format = self.config.history_format
+            if history_format != 'csv':
+                self._load_with_pandas(file_path, history_format)
+                appendable = False
+            elif pa_csv is not None:
+                appendable = self._load_with_pyarrow(file_path)
+            else:
+                appendable = self._load_with_csv(file_path)
+            
+            if tracked and appendable:
+                # Later saves can append to the file that was just loaded
+                self._mark_file_saved()
+            return True
+    
+    def _load_with_pandas(
+        self, file_path: Path, history_format: str
+    ) -> bool:
+        """Load history from Feather or Parquet; pandas needs pyarrow for both."""
+        import pandas as pd
         
-        if not file_path.exists():
-            return False  # File doesn't exist, not an error
+        try:
+            if history_format == 'feather':
+                df = pd.read_feather(file_path)
+            else:
+                df = pd.read_parquet(file_path)
+        except Exception as e:
+            raise HistoryError(
+                f"Failed to load history from {history_format.upper()}: {e}"
+            )
         
+        # Convert whole columns at once rather than row by row
         try:
-            # Read CSV into DataFrame
-            df = pd.read_csv(
-                file_path,
-                encoding=self.config.default_encoding
+            operations = df['operation'].tolist()
+            operands_a = df['operand_a'].to_numpy(dtype='float64').tolist()
+            operands_b = df['operand_b'].to_numpy(dtype='float64').tolist()
+            results = df['result'].to_numpy(dtype='float64').tolist()
+            timestamps = [
+                datetime.fromisoformat(ts).timestamp()
+                for ts in df['timestamp'].tolist()
+            ]
+        except Exception as e:
+            raise HistoryError(
+                f"Failed to parse calculation from "
+                f"{history_format.upper()}: {e}"
             )
-            
-            # Convert DataFrame rows to Calculation objects
-            calculations = []
-            for _, row in df.iterrows():
-                try:
-                    calc = Calculation.from_dict(row.to_dict())
-                    calculations.append(calc)
-                except Exception as e:
-                    raise HistoryError(
-                        f"Failed to parse calculation from CSV: {e}"
-                    )
-            
-            self._history = calculations
-            return True
-        except pd.errors.EmptyDataError:
-            # Empty file is okay
-            self._history = []
-            return True
+        
+        self._set_columns(
+            operations, operands_a, operands_b, results, timestamps
+        )
+        return True
+    
+    def _load_with_csv(self, file_path: Path) -> bool:
+        """
+        Load history from CSV with the stdlib csv module.
+        
+        Returns:
+            True if the file's header is exactly CSV_COLUMNS, so that
+            rows can be appended to it
+        """
+        try:
+            with open(
+                file_path, newline='', encoding=self.config.default_encoding
+            ) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                rows = [row for row in reader if row]
         except Exception as e:
             raise HistoryError(f"Failed to load history from CSV: {e}")
-
+        
+        appendable = tuple(header) == CSV_COLUMNS
+        if not rows:
+            # An empty file simply loads as empty history
+            self._set_columns([], [], [], [], [])
+            return appendable
+        
+        try:
+            # Look the columns up once, then index rows by position
+            index = {name: i for i, name in enumerate(header)}
+            op_i, a_i, b_i, result_i = (
+                index[name] for name in CSV_COLUMNS[:4]
+            )
+            operations = [row[op_i] for row in rows]
+            operands_a = [float(row[a_i]) for row in rows]
+            operands_b = [float(row[b_i]) for row in rows]
+            results = [float(row[result_i]) for row in rows]
+            ts_i = index.get('timestamp')
+            if ts_i is not None:
+                timestamps = [
+                    datetime.fromisoformat(row[ts_i]).timestamp()
+                    for row in rows
+                ]
+            else:
+                timestamps = [time.time()] * len(rows)
+        except Exception as e:
+            raise HistoryError(f"Failed to parse calculation from CSV: {e}")
+        
+        self._set_columns(
+            operations, operands_a, operands_b, results, timestamps
+        )
+        return appendable
+    
+    def _save_with_pyarrow(
+        self, file_path: Path, columns: dict[str, list]
+    ):
+        """Save history columns to CSV with pyarrow's native writer."""
+        try:
+            table = pa.Table.from_pydict(columns)
+            pa_csv.write_csv(table, str(file_path))
+        except Exception as e:
+            raise HistoryError(f"Failed to save history to CSV: {e}")
+    
+    def _load_with_pyarrow(self, file_path: Path) -> bool:
+        """
+        Load history from CSV with pyarrow's vectorized reader.
+        
+        Returns:
+            True if the file's header is exactly CSV_COLUMNS, so that
+            rows can be appended to it
+        """
+        convert_options = pa_csv.ConvertOptions(column_types={
+            'operation': pa.string(),
+            'operand_a': pa.float64(),
+            'operand_b': pa.float64(),
+            'result': pa.float64(),
+            'timestamp': pa.string(),
+        })
+        try:
+            table = pa_csv.read_csv(
+                str(file_path),
+                read_options=pa_csv.ReadOptions(
+                    encoding=self.config.default_encoding
+                ),
+                convert_options=convert_options
+            )
+        except pa.ArrowInvalid as e:
+            if file_path.stat().st_size == 0:
+                # Empty file is okay
+                self.clear_history()
+                return False
+            raise HistoryError(f"Failed to load history from CSV: {e}")
+        except Exception as e:
+            raise HistoryError(f"Failed to load history from CSV: {e}")
+        
+        try:
+            operations, operands_a, operands_b, results = (
+                table.column(name).to_pylist() for name in CSV_COLUMNS[:4]
+            )
+            if 'timestamp' in table.column_names:
+                timestamps = [
+                    datetime.fromisoformat(ts).timestamp()
+                    for ts in table.column('timestamp').to_pylist()
+                ]
+            else:
+                timestamps = [time.time()] * table.num_rows
+            self._set_columns(
+                operations, operands_a, operands_b, results, timestamps
+            )
+            return tuple(table.column_names) == CSV_COLUMNS
+        except Exception as e:
+            raise HistoryError(f"Failed to parse calculation from CSV: {e}")
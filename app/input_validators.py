@@ -1,8 +1,52 @@
 """Input validation utilities for the calculator."""
 
+import functools
 from app.exceptions import ValidationError
 from app.calculator_config import CalculatorConfig
 
+# fastnumbers is an optional faster str -> float conversion
+try:
+    from fastnumbers import fast_float
+except ImportError:
+    fast_float = None
+
+_to_float = (
+    float if fast_float is None
+    else functools.partial(fast_float, raise_on_invalid=True)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_number(value: str, max_input_value: float) -> float:
+    """
+    Convert a string to a number within the allowed range.
+    
+    Results are cached, since REPL input repeats the same short numbers;
+    invalid input raises and is therefore never cached.
+    
+    Args:
+        value: String representation of a number
+        max_input_value: Largest allowed absolute value
+        
+    Returns:
+        Validated float value
+        
+    Raises:
+        ValidationError: If value is not a valid number or exceeds limits
+    """
+    try:
+        num = _to_float(value)
+    except ValueError:
+        raise ValidationError(f"'{value}' is not a valid number")
+    
+    if abs(num) > max_input_value:
+        raise ValidationError(
+            f"Input value {num} exceeds maximum allowed value "
+            f"{max_input_value}"
+        )
+    
+    return num
+
 
 class InputValidator:
     """Validates user inputs for calculator operations."""
@@ -24,18 +68,7 @@ class InputValidator:
         Raises:
             ValidationError: If value is not a valid number or exceeds limits
         """
-        try:
-            num = float(value)
-        except ValueError:
-            raise ValidationError(f"'{value}' is not a valid number")
-        
-        if abs(num) > self.config.max_input_value:
-            raise ValidationError(
-                f"Input value {num} exceeds maximum allowed value "
-                f"{self.config.max_input_value}"
-            )
-        
-        return num
+        return _parse_number(value, self.config.max_input_value)
     
     def validate_two_numbers(self, a_str: str, b_str: str) -> tuple[float, float]:
         """
@@ -54,4 +87,38 @@ class InputValidator:
         a = self.validate_number(a_str)
         b = self.validate_number(b_str)
         return a, b
+    
+    def validate_numbers_bulk(self, a_values, b_values) -> tuple:
+        """
+        Validate two columns of numbers in a single vectorized pass.
+        
+        Args:
+            a_values: Sequence or array of first operands
+            b_values: Sequence or array of second operands
+            
+        Returns:
+            Tuple of validated float64 numpy arrays
+            
+        Raises:
+            ValidationError: If any value is not a number or exceeds limits
+        """
+        import numpy as np
+        
+        try:
+            a_arr = np.asarray(a_values, dtype=np.float64)
+            b_arr = np.asarray(b_values, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid numeric input: {e}")
+        
+        max_value = self.config.max_input_value
+        for arr in (a_arr, b_arr):
+            over_limit = np.abs(arr) > max_value
+            if over_limit.any():
+                num = arr[over_limit][0]
+                raise ValidationError(
+                    f"Input value {num} exceeds maximum allowed value "
+                    f"{max_value}"
+                )
+        
+        return a_arr, b_arr
 
@@ -1,30 +1,92 @@
 """Logging functionality for the calculator."""
 
+import atexit
+import functools
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from app.calculator_config import CalculatorConfig
 
+# %-style template; logging fills it in only if the record is emitted
+_CALC_FMT = "Calculation: %s(%s, %s) = %s"
 
-class Logger:
-    """Logger for calculator operations."""
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes through a large stream buffer."""
     
-    _instance = None
-    _initialized = False
+    def __init__(
+        self,
+        filename,
+        encoding=None,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.WARNING,
+        delay: bool = False
+    ):
+        """
+        Initialize the buffered file handler.
+        
+        Args:
+            filename: Path of the log file
+            encoding: File encoding
+            buffer_size: Size of the write buffer in bytes
+            flush_level: Records at or above this level are flushed at once
+            delay: Defer opening the file until the first record is written
+        """
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, encoding=encoding, delay=delay)
     
-    def __new__(cls):
-        """Singleton pattern implementation."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
     
-    def __init__(self):
-        """Initialize logger if not already initialized."""
-        if Logger._initialized:  # pragma: no cover
-            return
+    def emit(self, record: logging.LogRecord):
+        """
+        Write a record, flushing only for warnings and errors.
         
+        StreamHandler flushes after every record, which turns each log
+        call into a write syscall; here the buffer is flushed when full,
+        on important records, and when the handler is closed.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except Exception:  # pragma: no cover
+            self.handleError(record)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Enqueue the record unchanged.
+        
+        The stock QueueHandler formats the message in the calling thread
+        so records can be pickled; the queue here never leaves the
+        process, so formatting is left to the listener thread.
+        """
+        return record
+
+
+class CalculatorLogger:
+    """Logger for calculator operations."""
+    
+    def __init__(self):
+        """Initialize logger; use get_logger() for the shared instance."""
         self.config = CalculatorConfig()
         self._setup_logger()
-        Logger._initialized = True
     
     def _setup_logger(self):
         """Configure the logger."""
@@ -34,10 +96,12 @@ class Logger:
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
         
-        # File handler
-        file_handler = logging.FileHandler(
-            self.config.log_file,
-            encoding=self.config.default_encoding
+        # File handler; the file is only opened once something is logged,
+        # and logging.shutdown() flushes it at exit
+        file_handler = BufferedFileHandler(
+            os.fspath(self.config.log_file),
+            encoding=self.config.default_encoding,
+            delay=True
         )
         file_handler.setLevel(logging.INFO)
         
@@ -52,24 +116,51 @@ class Logger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Callers only enqueue records; a background listener thread does
+        # the formatting and I/O. Stopping it at exit drains the queue.
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(DeferredQueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue,
+            file_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
+        
+        # Bound methods cached to skip attribute lookups per call
+        self._info = self.logger.info
+        self._warning = self.logger.warning
+        self._error = self.logger.error
+    
+    def info_enabled(self) -> bool:
+        """Check whether info messages would be logged."""
+        return self.logger.isEnabledFor(logging.INFO)
     
     def log_calculation(self, operation: str, a: float, b: float, result: float):
         """Log a calculation operation."""
-        self.logger.info(
-            f"Calculation: {operation}({a}, {b}) = {result}"
-        )
+        self._info(_CALC_FMT, operation, a, b, result)
     
-    def log_error(self, message: str):
-        """Log an error."""
-        self.logger.error(message)
+    def log_error(self, message: str, *args):
+        """Log an error, %-formatting message with args when emitted."""
+        self._error(message, *args)
     
-    def log_warning(self, message: str):
-        """Log a warning."""
-        self.logger.warning(message)
+    def log_warning(self, message: str, *args):
+        """Log a warning, %-formatting message with args when emitted."""
+        self._warning(message, *args)
     
-    def log_info(self, message: str):
-        """Log an info message."""
-        self.logger.info(message)
+    def log_info(self, message: str, *args):
+        """Log an info message, %-formatting message with args when emitted."""
+        self._info(message, *args)
+
+
+@functools.lru_cache(maxsize=None)
+def get_logger() -> CalculatorLogger:
+    """Get the shared calculator logger, creating it on first use."""
+    return CalculatorLogger()
+
+
+# Existing ``Logger()`` call sites get the shared instance
+Logger = get_logger
 
@@ -1,34 +1,43 @@
 """Observer Pattern implementation for calculator events."""
 
-from abc import ABC, abstractmethod
+import threading
 from app.calculation import Calculation
+from app.logger import get_logger
 
 
-class CalculatorObserver(ABC):
-    """Abstract observer for calculator events."""
+class CalculatorObserver:
+    """Base observer for calculator events."""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def on_calculation(self, calculation: Calculation):
         """
         Called when a new calculation is performed.
         
         Args:
             calculation: The calculation that was performed
+            
+        Raises:
+            NotImplementedError: If a subclass does not override it
         """
-        pass
+        raise NotImplementedError
 
 
 class LoggingObserver(CalculatorObserver):
     """Observer that logs calculations."""
     
+    __slots__ = ('logger', '_log_calculation')
+    
     def __init__(self):
         """Initialize logging observer."""
-        from app.logger import Logger
-        self.logger = Logger()
+        self.logger = get_logger()
+        self._log_calculation = self.logger.log_calculation
     
     def on_calculation(self, calculation: Calculation):
         """Log the calculation."""
-        self.logger.log_calculation(
+        if not self.logger.info_enabled():
+            return
+        self._log_calculation(
             calculation.operation,
             calculation.operand_a,
             calculation.operand_b,
@@ -37,23 +46,58 @@ class LoggingObserver(CalculatorObserver):
 
 
 class AutoSaveObserver(CalculatorObserver):
-    """Observer that auto-saves calculation history."""
+    """Observer that periodically auto-saves calculation history."""
+    
+    __slots__ = (
+        'history_manager', 'logger', 'interval',
+        '_dirty', '_lock', '_stopped', '_thread'
+    )
     
-    def __init__(self, history_manager):
+    def __init__(self, history_manager, interval: float = 1.0):
         """
         Initialize auto-save observer.
         
+        Starts a daemon thread that saves the history every ``interval``
+        seconds if any calculations were performed since the last save.
+        
         Args:
             history_manager: HistoryManager instance to use for saving
+            interval: Seconds between background saves
         """
         self.history_manager = history_manager
+        self.logger = get_logger()
+        self.interval = interval
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name='calculator-autosave', daemon=True
+        )
+        self._thread.start()
     
     def on_calculation(self, calculation: Calculation):
-        """Auto-save the calculation history."""
-        try:
-            self.history_manager.save_to_csv()
-        except Exception as e:
-            from app.logger import Logger
-            logger = Logger()
-            logger.log_error(f"Auto-save failed: {e}")
-
+        """Mark the history as needing a save."""
+        self._dirty = True
+    
+    def _run(self):
+        """Flush the history every interval until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.flush()
+    
+    def flush(self):
+        """Save the history if any calculations are still unsaved."""
+        with self._lock:
+            if not self._dirty:
+                return
+            # Clear first so calculations made during the save mark it dirty
+            self._dirty = False
+            try:
+                self.history_manager.save_to_csv()
+            except Exception as e:
+                self.logger.log_error("Auto-save failed: %s", e)
+    
+    def stop(self):
+        """Stop the background thread and save any unsaved calculations."""
+        self._stopped.set()
+        self._thread.join()
+        self.flush()
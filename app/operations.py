@@ -1,13 +1,95 @@
 """Operations module implementing Factory Pattern for calculator operations."""
 
-from abc import ABC, abstractmethod
+import math
+import operator
+from typing import Callable
 from app.exceptions import OperationError
 
 
-class Operation(ABC):
-    """Abstract base class for calculator operations."""
+def divide(a: float, b: float) -> float:
+    """Divide a by b."""
+    if b == 0:
+        raise OperationError("Division by zero is not allowed")
+    return a / b
+
+
+def power(a: float, b: float) -> float:
+    """Raise a to the power of b."""
+    # Only a negative base with a fractional exponent has a complex result
+    if a < 0 and not float(b).is_integer():
+        raise OperationError(
+            f"Invalid result for power operation: {a} ** {b}"
+        )
+    try:
+        return math.pow(a, b)
+    except (ValueError, OverflowError) as e:
+        raise OperationError(
+            f"Error computing power: {e}"
+        )
+
+
+def root(a: float, b: float) -> float:
+    """Calculate the bth root of a."""
+    if b == 0:
+        raise OperationError("Cannot calculate 0th root")
+    if a < 0 and b % 2 == 0:
+        raise OperationError(
+            "Cannot calculate even root of negative number"
+        )
+    try:
+        result = math.pow(abs(a), 1.0 / b)
+    except (ValueError, OverflowError) as e:
+        raise OperationError(f"Error computing root: {e}")
+    # Odd roots of negative numbers keep the sign of a
+    return math.copysign(result, a) if a < 0 else result
+
+
+def modulus(a: float, b: float) -> float:
+    """Compute a modulo b."""
+    if b == 0:
+        raise OperationError("Modulus by zero is not allowed")
+    return float(operator.mod(a, b))
+
+
+def int_divide(a: float, b: float) -> float:
+    """Perform integer division of a by b."""
+    if b == 0:
+        raise OperationError("Integer division by zero is not allowed")
+    return float(operator.floordiv(a, b))
+
+
+def percent(a: float, b: float) -> float:
+    """Calculate (a / b) * 100."""
+    if b == 0:
+        raise OperationError("Cannot calculate percentage with zero denominator")
+    return (a / b) * 100
+
+
+def abs_diff(a: float, b: float) -> float:
+    """Calculate absolute difference between a and b."""
+    return abs(a - b)
+
+
+# Operation name -> implementation, for callers that only need the result
+OPERATIONS: dict[str, Callable[[float, float], float]] = {
+    'add': operator.add,
+    'subtract': operator.sub,
+    'multiply': operator.mul,
+    'divide': divide,
+    'power': power,
+    'root': root,
+    'modulus': modulus,
+    'int_divide': int_divide,
+    'percent': percent,
+    'abs_diff': abs_diff,
+}
+
+
+class Operation:
+    """Base class for calculator operations."""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def execute(self, a: float, b: float) -> float:
         """
         Execute the operation.
@@ -18,20 +100,62 @@ class Operation(ABC):
             
         Returns:
             Result of the operation
+            
+        Raises:
+            NotImplementedError: If a subclass does not override it
         """
-        pass
+        raise NotImplementedError
+    
+    def execute_batch(self, a, b):
+        """
+        Execute the operation element-wise over arrays of operands.
+        
+        Args:
+            a: Array-like of first operands
+            b: Array-like of second operands
+            
+        Returns:
+            float64 numpy array of results
+            
+        Raises:
+            OperationError: If the operation fails for any element
+        """
+        # Imported here so that scalar use does not pay for numpy
+        import numpy as np
+        
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        try:
+            with np.errstate(over='raise', divide='raise', invalid='raise'):
+                return self._execute_batch(a, b)
+        except FloatingPointError as e:
+            raise OperationError(f"Error computing {self.get_name()}: {e}")
+    
+    def _execute_batch(self, a, b):
+        """
+        Compute the element-wise results for float64 arrays.
+        
+        Raises:
+            NotImplementedError: If a subclass does not override it
+        """
+        raise NotImplementedError
     
-    @abstractmethod
     def get_name(self) -> str:
         """Get the name of the operation."""
-        pass
+        raise NotImplementedError
 
 
 class AddOperation(Operation):
     """Addition operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Add two numbers."""
+        return operator.add(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Add two arrays element-wise."""
         return a + b
     
     def get_name(self) -> str:
@@ -42,8 +166,14 @@ class AddOperation(Operation):
 class SubtractOperation(Operation):
     """Subtraction operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Subtract b from a."""
+        return operator.sub(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Subtract b from a element-wise."""
         return a - b
     
     def get_name(self) -> str:
@@ -54,8 +184,14 @@ class SubtractOperation(Operation):
 class MultiplyOperation(Operation):
     """Multiplication operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Multiply two numbers."""
+        return operator.mul(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Multiply two arrays element-wise."""
         return a * b
     
     def get_name(self) -> str:
@@ -66,9 +202,15 @@ class MultiplyOperation(Operation):
 class DivideOperation(Operation):
     """Division operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Divide a by b."""
-        if b == 0:
+        return divide(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Divide a by b element-wise."""
+        if (b == 0).any():
             raise OperationError("Division by zero is not allowed")
         return a / b
     
@@ -80,27 +222,21 @@ class DivideOperation(Operation):
 class PowerOperation(Operation):
     """Power operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Raise a to the power of b."""
-        try:
-            result = a ** b
-            # Check if result is complex (has imaginary part)
-            if isinstance(result, complex):
-                if result.imag != 0:
-                    raise OperationError(
-                        f"Invalid result for power operation: {a} ** {b}"
-                    )
-                result = result.real
-            # Check for invalid types
-            if not isinstance(result, (int, float)):
-                raise OperationError(
-                    f"Invalid result for power operation: {a} ** {b}"
-                )
-            return float(result)
-        except (ValueError, OverflowError) as e:
+        return power(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Raise a to the power of b element-wise."""
+        complex_result = (a < 0) & (b % 1 != 0)
+        if complex_result.any():
+            i = complex_result.argmax()
             raise OperationError(
-                f"Error computing power: {e}"
+                f"Invalid result for power operation: {a[i]} ** {b[i]}"
             )
+        return a ** b
     
     def get_name(self) -> str:
         """Get operation name."""
@@ -110,23 +246,23 @@ class PowerOperation(Operation):
 class RootOperation(Operation):
     """Root operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Calculate the bth root of a."""
-        if b == 0:
+        return root(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Calculate the bth root of a element-wise."""
+        import numpy as np
+        
+        if (b == 0).any():
             raise OperationError("Cannot calculate 0th root")
-        if a < 0 and b % 2 == 0:
+        if ((a < 0) & (b % 2 == 0)).any():
             raise OperationError(
                 "Cannot calculate even root of negative number"
             )
-        try:
-            if a < 0:
-                # For odd roots of negative numbers
-                result = -((-a) ** (1 / b))
-            else:
-                result = a ** (1 / b)
-            return float(result)
-        except (ValueError, OverflowError, ZeroDivisionError) as e:
-            raise OperationError(f"Error computing root: {e}")
+        return np.copysign(abs(a) ** (1.0 / b), a)
     
     def get_name(self) -> str:
         """Get operation name."""
@@ -136,11 +272,17 @@ class RootOperation(Operation):
 class ModulusOperation(Operation):
     """Modulus operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Compute a modulo b."""
-        if b == 0:
+        return modulus(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Compute a modulo b element-wise."""
+        if (b == 0).any():
             raise OperationError("Modulus by zero is not allowed")
-        return float(a % b)
+        return a % b
     
     def get_name(self) -> str:
         """Get operation name."""
@@ -150,11 +292,17 @@ class ModulusOperation(Operation):
 class IntDivideOperation(Operation):
     """Integer division operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Perform integer division of a by b."""
-        if b == 0:
+        return int_divide(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Perform integer division of a by b element-wise."""
+        if (b == 0).any():
             raise OperationError("Integer division by zero is not allowed")
-        return float(a // b)
+        return a // b
     
     def get_name(self) -> str:
         """Get operation name."""
@@ -164,9 +312,15 @@ class IntDivideOperation(Operation):
 class PercentOperation(Operation):
     """Percentage calculation operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Calculate (a / b) * 100."""
-        if b == 0:
+        return percent(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Calculate (a / b) * 100 element-wise."""
+        if (b == 0).any():
             raise OperationError("Cannot calculate percentage with zero denominator")
         return (a / b) * 100
     
@@ -178,8 +332,14 @@ class PercentOperation(Operation):
 class AbsDiffOperation(Operation):
     """Absolute difference operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         """Calculate absolute difference between a and b."""
+        return abs_diff(a, b)
+    
+    def _execute_batch(self, a, b):
+        """Calculate absolute difference between a and b element-wise."""
         return abs(a - b)
     
     def get_name(self) -> str:
@@ -190,7 +350,8 @@ class AbsDiffOperation(Operation):
 class OperationFactory:
     """Factory for creating operation instances."""
     
-    _operations = {
+    # Operation classes keyed by lowercase name
+    _REGISTRY: dict[str, type[Operation]] = {
         'add': AddOperation,
         'subtract': SubtractOperation,
         'multiply': MultiplyOperation,
@@ -202,31 +363,64 @@ class OperationFactory:
         'percent': PercentOperation,
         'abs_diff': AbsDiffOperation,
     }
+    # Operations are stateless, so one shared instance per name suffices
+    _instances: dict[str, Operation] = {
+        name: op_cls() for name, op_cls in _REGISTRY.items()
+    }
+    # Bound execute methods, for callers that only need the result
+    _EXECUTORS: dict[str, Callable[[float, float], float]] = {
+        name: instance.execute for name, instance in _instances.items()
+    }
+    _AVAILABLE_OPS_MSG = ', '.join(_REGISTRY)
     
     @classmethod
     def create_operation(cls, operation_name: str) -> Operation:
         """
-        Create an operation instance by name.
+        Get the operation instance for a name.
         
         Args:
             operation_name: Name of the operation
             
         Returns:
-            Operation instance
+            Shared operation instance
             
         Raises:
             OperationError: If operation name is invalid
         """
-        operation_name = operation_name.lower()
-        if operation_name not in cls._operations:
-            raise OperationError(
-                f"Unknown operation: {operation_name}. "
-                f"Available operations: {', '.join(cls._operations.keys())}"
-            )
-        return cls._operations[operation_name]()
+        # Names are usually lowercase already; only normalize on a miss
+        operation = cls._instances.get(operation_name)
+        if operation is None:
+            operation_name = operation_name.lower()
+            operation = cls._instances.get(operation_name)
+            if operation is None:
+                raise OperationError(
+                    f"Unknown operation: {operation_name}. "
+                    f"Available operations: {cls._AVAILABLE_OPS_MSG}"
+                )
+        return operation
+    
+    @classmethod
+    def execute(cls, operation_name: str, a: float, b: float) -> float:
+        """
+        Execute an operation by name.
+        
+        Args:
+            operation_name: Name of the operation
+            a: First operand
+            b: Second operand
+            
+        Returns:
+            Result of the operation
+            
+        Raises:
+            OperationError: If operation name is invalid or the operation fails
+        """
+        executor = cls._EXECUTORS.get(operation_name)
+        if executor is None:
+            executor = cls.create_operation(operation_name).execute
+        return executor(a, b)
     
     @classmethod
     def get_available_operations(cls) -> list[str]:
         """Get list of available operation names."""
-        return list(cls._operations.keys())
-
+        return list(cls._REGISTRY)
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from app.calculator_config import CalculatorConfig
+from app.history import HistoryManager
+
+
+@pytest.fixture(scope="module")
+def config(tmp_path_factory):
+    """Calculator config whose history file lives in a temporary directory."""
+    config = CalculatorConfig()
+    config.history_file = tmp_path_factory.mktemp("history") / "history.csv"
+    return config
+
+
+@pytest.fixture(scope="module")
+def history_manager(config):
+    """History manager shared by all tests in a module."""
+    return HistoryManager(config)
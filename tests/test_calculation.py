@@ -51,4 +51,11 @@ class TestCalculation:
         assert calc.operand_a == 5
         assert calc.operand_b == 3
         assert calc.result == 8
+    
+    def test_calculation_timestamp_round_trip(self):
+        """Test that an explicit timestamp is preserved."""
+        timestamp = datetime(2024, 1, 2, 3, 4, 5, 678901)
+        calc = Calculation('add', 5, 3, 8, timestamp=timestamp)
+        assert calc.timestamp == timestamp
+        assert calc.to_dict()['timestamp'] == timestamp.isoformat()
 
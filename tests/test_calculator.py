@@ -21,6 +21,14 @@ class TestCalculator:
                                     with patch('app.calculator.AutoSaveObserver'):
                                         self.calculator = Calculator()
     
+    def test_close_stops_auto_save_once(self):
+        """Test close saves through the auto-save observer only once."""
+        observer = self.calculator._auto_save_observer
+        self.calculator.close()
+        self.calculator.close()
+        observer.stop.assert_called_once()
+        assert observer not in self.calculator._observers
+    
     def test_process_command_add(self):
         """Test processing add command."""
         with patch.object(self.calculator, '_perform_calculation', return_value=8.0):
@@ -34,20 +42,27 @@ class TestCalculator:
             assert 'Error: Invalid number' in result
 
     
+    def test_process_command_tab_separated(self):
+        """Test commands and arguments may be separated by any whitespace."""
+        with patch.object(self.calculator, '_perform_calculation', return_value=8.0) as mock_calc:
+            result = self.calculator._process_command('add\t5 \t3')
+            mock_calc.assert_called_once_with('add', '5', '3')
+            assert 'Result: 8.0' in result
+    
     def test_process_command_history(self):
         """Test processing history command."""
         mock_calc = Calculation('add', 5, 3, 8)
         with patch.object(
             self.calculator.history_manager,
-            'get_history',
-            return_value=[mock_calc]
+            'history_view',
+            return_value=(mock_calc,)
         ):
             result = self.calculator._process_command('history')
             assert 'History' in result or 'add' in result
     
     def test_process_command_history_empty(self):
         """Test processing history command when history is empty."""
-        with patch.object(self.calculator.history_manager, 'get_history', return_value=[]):
+        with patch.object(self.calculator.history_manager, 'history_view', return_value=()):
             result = self.calculator._process_command('history')
             assert 'No calculations' in result
 
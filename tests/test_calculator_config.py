@@ -25,12 +25,40 @@ class TestCalculatorConfig:
         assert config.log_dir.is_dir()
         assert config.history_dir.is_dir()
     
+    def test_nested_dirs_created(self, monkeypatch, tmp_path):
+        """Test that nested log and history directories are created."""
+        monkeypatch.setenv('CALCULATOR_LOG_DIR', str(tmp_path / 'a' / 'logs'))
+        monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path / 'b' / 'hist'))
+        config = CalculatorConfig()
+        assert config.log_dir.is_dir()
+        assert config.history_dir.is_dir()
+    
     def test_file_paths(self):
         """Test that file paths are set correctly."""
         config = CalculatorConfig()
         assert config.log_file == config.log_dir / 'calculator.log'
         assert config.history_file == config.history_dir / 'history.csv'
 
+    def test_history_format(self, monkeypatch):
+        """Test the history format selects the history file extension."""
+        assert CalculatorConfig().history_format == 'csv'
+        monkeypatch.setenv('CALCULATOR_HISTORY_FORMAT', 'Parquet')
+        config = CalculatorConfig()
+        assert config.history_format == 'parquet'
+        assert config.history_file == config.history_dir / 'history.parquet'
+    
+    def test_config_invalid_history_format(self, monkeypatch):
+        """Test unknown history format raises error."""
+        monkeypatch.setenv('CALCULATOR_HISTORY_FORMAT', 'xml')
+        with pytest.raises(ConfigurationError):
+            CalculatorConfig()
+
+    def test_config_picks_up_env_changes(self, monkeypatch):
+        """Test that cached parsing still sees changed environment values."""
+        assert CalculatorConfig().max_history_size == 100
+        monkeypatch.setenv('CALCULATOR_MAX_HISTORY_SIZE', '50')
+        assert CalculatorConfig().max_history_size == 50
+    
     def test_config_invalid_max_history(self, monkeypatch):
         """Test invalid max history size raises error."""
         monkeypatch.setenv('CALCULATOR_MAX_HISTORY_SIZE', 'invalid')
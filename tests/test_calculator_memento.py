@@ -41,6 +41,17 @@ class TestCalculatorOriginator:
         
         originator.restore_state(memento)
         assert len(originator.get_history()) == 1
+    
+    def test_save_state_shares_snapshot(self):
+        """Test that mementos share the immutable history snapshot."""
+        originator = CalculatorOriginator()
+        originator.add_calculation(Calculation('add', 1, 2, 3))
+        first = originator.save_state()
+        second = originator.save_state()
+        assert first.history is second.history
+        
+        originator.add_calculation(Calculation('subtract', 5, 2, 3))
+        assert len(first.history) == 1
 
 
 class TestCalculatorCaretaker:
@@ -111,3 +122,25 @@ class TestCalculatorCaretaker:
         self.caretaker.save_state()
         
         assert not self.caretaker.can_redo()
+    
+    def test_undo_stack_bounded(self):
+        """Test that the undo stack keeps at most max_states mementos."""
+        originator = CalculatorOriginator()
+        caretaker = CalculatorCaretaker(originator, max_states=3)
+        for i in range(10):
+            originator.add_calculation(Calculation('add', i, 1, i + 1))
+            caretaker.save_state()
+        
+        assert caretaker.undo()
+        assert caretaker.undo()
+        assert not caretaker.undo()
+        assert len(originator.get_history()) == 8
+    
+    def test_negative_max_states_keeps_nothing(self):
+        """Test a negative max_states is treated as zero."""
+        originator = CalculatorOriginator()
+        caretaker = CalculatorCaretaker(originator, max_states=-1)
+        originator.add_calculation(Calculation('add', 1, 2, 3))
+        caretaker.save_state()
+        
+        assert not caretaker.can_undo()
@@ -1,8 +1,6 @@
 """Additional edge case tests."""
 
 import pytest
-from app.history import HistoryManager
-from app.calculator_config import CalculatorConfig
 from app.calculation import Calculation
 from app.exceptions import HistoryError
 
@@ -10,20 +8,11 @@ from app.exceptions import HistoryError
 class TestEdgeCases:
     """Edge case tests for better coverage."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = CalculatorConfig()
-        self.history_manager = HistoryManager(self.config)
-        self.history_manager.clear_history()
-    
-    def teardown_method(self):
-        """Clean up test files."""
-        if self.config.history_file.exists():
-            self.config.history_file.unlink()
-    
-    def test_save_empty_history(self):
+    def test_save_empty_history(self, history_manager):
         """Test saving empty history."""
-        assert self.history_manager.save_to_csv()
+        history_manager.clear_history()
+        assert history_manager.save_to_csv()
+        assert not history_manager.config.history_file.exists()
     
     def test_calculation_repr(self):
         """Test calculation representation."""
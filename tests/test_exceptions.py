@@ -13,28 +13,15 @@ from app.exceptions import (
 class TestExceptions:
     """Tests for custom exceptions."""
     
-    def test_calculator_error(self):
-        """Test CalculatorError base exception."""
-        with pytest.raises(CalculatorError):
-            raise CalculatorError("Test error")
-    
-    def test_operation_error(self):
-        """Test OperationError exception."""
-        with pytest.raises(OperationError):
-            raise OperationError("Operation failed")
-    
-    def test_validation_error(self):
-        """Test ValidationError exception."""
-        with pytest.raises(ValidationError):
-            raise ValidationError("Validation failed")
-    
-    def test_history_error(self):
-        """Test HistoryError exception."""
-        with pytest.raises(HistoryError):
-            raise HistoryError("History error")
-    
-    def test_configuration_error(self):
-        """Test ConfigurationError exception."""
-        with pytest.raises(ConfigurationError):
-            raise ConfigurationError("Configuration error")
-
+    @pytest.mark.parametrize("exc_cls,msg", [
+        (CalculatorError, "Test error"),
+        (OperationError, "Operation failed"),
+        (ValidationError, "Validation failed"),
+        (HistoryError, "History error"),
+        (ConfigurationError, "Configuration error"),
+    ])
+    def test_exception_raises(self, exc_cls, msg):
+        """Test each calculator exception can be raised and caught."""
+        with pytest.raises(CalculatorError, match=msg) as exc_info:
+            raise exc_cls(msg)
+        assert type(exc_info.value) is exc_cls
@@ -1,7 +1,7 @@
 """Tests for history management."""
 
+import csv
 import os
-import pandas as pd
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -14,108 +14,409 @@ from app.exceptions import HistoryError
 class TestHistoryManager:
     """Tests for HistoryManager class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = CalculatorConfig()
-        self.history_manager = HistoryManager(self.config)
-        self.history_manager.clear_history()
+    @pytest.fixture(autouse=True, params=['csv', 'pyarrow'])
+    def csv_backend(self, request, monkeypatch):
+        """Run each test with the pyarrow and the fallback CSV backends."""
+        if request.param == 'pyarrow':
+            pytest.importorskip('pyarrow')
+        else:
+            monkeypatch.setattr('app.history.pa_csv', None)
+        return request.param
     
-    def teardown_method(self):
-        """Clean up test files."""
-        if self.config.history_file.exists():
-            self.config.history_file.unlink()
+    @pytest.fixture(autouse=True)
+    def reset_history(self, history_manager):
+        """Start each test with empty history and no history file."""
+        history_manager.clear_history()
+        yield
+        history_manager.config.history_file.unlink(missing_ok=True)
     
-    def test_add_calculation(self):
+    def read_rows(self, history_manager):
+        """Read the history file rows as dicts."""
+        with open(history_manager.config.history_file, newline='') as f:
+            return list(csv.DictReader(f))
+    
+    def test_add_calculation(self, history_manager):
         """Test adding a calculation."""
         calc = Calculation('add', 5, 3, 8)
-        self.history_manager.add_calculation(calc)
-        assert len(self.history_manager.get_history()) == 1
+        history_manager.add_calculation(calc)
+        assert len(history_manager.get_history()) == 1
     
-    def test_get_history(self):
+    def test_get_history(self, history_manager):
         """Test getting history."""
         calc = Calculation('add', 5, 3, 8)
-        self.history_manager.add_calculation(calc)
-        history = self.history_manager.get_history()
+        history_manager.add_calculation(calc)
+        history = history_manager.get_history()
         assert len(history) == 1
         assert history[0].operation == 'add'
     
-    def test_clear_history(self):
+    def test_get_history_preserves_timestamp(self, history_manager):
+        """Test that history rebuilds calculations with their timestamps."""
+        calc = Calculation('add', 5, 3, 8)
+        history_manager.add_calculation(calc)
+        restored = history_manager.get_history()[0]
+        assert restored.timestamp == calc.timestamp
+        assert restored.result == 8
+    
+    def test_history_view_reused_until_changed(self, history_manager):
+        """Test that the history view is shared until history changes."""
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        view = history_manager.history_view()
+        assert history_manager.history_view() is view
+        
+        history_manager.add_calculation(Calculation('add', 1, 1, 2))
+        new_view = history_manager.history_view()
+        assert new_view is not view
+        assert len(new_view) == 2
+        assert new_view[0].result == 8
+    
+    def test_clear_history(self, history_manager):
         """Test clearing history."""
         calc = Calculation('add', 5, 3, 8)
-        self.history_manager.add_calculation(calc)
-        self.history_manager.clear_history()
-        assert len(self.history_manager.get_history()) == 0
+        history_manager.add_calculation(calc)
+        history_manager.clear_history()
+        assert len(history_manager.get_history()) == 0
     
-    def test_history_size_limit(self):
+    def test_history_size_limit(self, history_manager):
         """Test history size limit."""
-        for i in range(150):
-            calc = Calculation('add', i, i+1, 2*i+1)
-            self.history_manager.add_calculation(calc)
+        history_manager.set_history(
+            [Calculation('add', i, i+1, 2*i+1) for i in range(150)]
+        )
+        
+        history = history_manager.get_history()
+        assert len(history) == history_manager.config.max_history_size
+        assert history[-1].operand_a == 149
+    
+    def test_add_calculation_size_limit(self, history_manager):
+        """Test adding to a full history drops the oldest calculation."""
+        max_size = history_manager.config.max_history_size
+        history_manager.set_history(
+            [Calculation('add', i, 1, i + 1) for i in range(max_size)]
+        )
+        history_manager.add_calculation(Calculation('add', -1, 1, 0))
+        
+        history = history_manager.get_history()
+        assert len(history) == max_size
+        assert history[0].operand_a == 1
+        assert history[-1].operand_a == -1
+    
+    def test_add_calculation_wraps_around(self, history_manager):
+        """Test history stays in order after the buffer wraps repeatedly."""
+        max_size = history_manager.config.max_history_size
+        for i in range(2 * max_size + 3):
+            history_manager.add_calculation(Calculation('add', i, 1, i + 1))
         
-        history = self.history_manager.get_history()
-        assert len(history) == self.config.max_history_size
+        operands = [calc.operand_a for calc in history_manager.get_history()]
+        assert operands == list(range(max_size + 3, 2 * max_size + 3))
+    
+    def test_zero_history_size(self):
+        """Test a zero history size keeps no calculations."""
+        zero_config = CalculatorConfig()
+        zero_config.max_history_size = 0
+        manager = HistoryManager(zero_config)
+        manager.add_calculation(Calculation('add', 5, 3, 8))
+        assert manager.get_history() == []
     
-    def test_save_to_csv(self):
+    def test_save_to_csv(self, history_manager):
         """Test saving history to CSV."""
         calc1 = Calculation('add', 5, 3, 8)
         calc2 = Calculation('subtract', 10, 4, 6)
-        self.history_manager.add_calculation(calc1)
-        self.history_manager.add_calculation(calc2)
+        history_manager.add_calculation(calc1)
+        history_manager.add_calculation(calc2)
         
-        self.history_manager.save_to_csv()
-        assert self.config.history_file.exists()
+        history_manager.save_to_csv()
+        assert history_manager.config.history_file.exists()
         
         # Verify CSV content
-        df = pd.read_csv(self.config.history_file)
-        assert len(df) == 2
-        assert df.iloc[0]['operation'] == 'add'
-        assert df.iloc[1]['operation'] == 'subtract'
+        rows = self.read_rows(history_manager)
+        assert len(rows) == 2
+        assert rows[0]['operation'] == 'add'
+        assert rows[1]['operation'] == 'subtract'
+    
+    def test_save_appends_new_rows(self, history_manager):
+        """Test later saves append only the new calculations."""
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        history_manager.save_to_csv()
+        
+        history_manager.add_calculation(Calculation('subtract', 10, 4, 6))
+        with patch.object(history_manager, '_write_columns') as mock_write:
+            history_manager.save_to_csv()
+            history_manager.save_to_csv()
+        mock_write.assert_not_called()
+        
+        rows = self.read_rows(history_manager)
+        assert [row['operation'] for row in rows] == ['add', 'subtract']
+        assert float(rows[1]['result']) == 6
+    
+    def test_appended_rows_use_file_line_endings(self, history_manager):
+        """Test appended rows end with LF like the rewritten rows."""
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        history_manager.save_to_csv()
+        history_manager.add_calculation(Calculation('subtract', 10, 4, 6))
+        history_manager.save_to_csv()
+        
+        data = history_manager.config.history_file.read_bytes()
+        assert b'\r' not in data
+        assert data.count(b'\n') == 3
+    
+    def test_saves_hold_io_lock(self, history_manager):
+        """Test rewrites and appends both write under the file I/O lock."""
+        held = []
+        
+        def record(*args):
+            held.append(history_manager._io_lock.locked())
+            return True
+        
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        with patch.object(history_manager, '_write_columns', side_effect=record):
+            history_manager.save_to_csv()
+        history_manager.config.history_file.touch()
+        history_manager.add_calculation(Calculation('add', 1, 1, 2))
+        with patch.object(history_manager, '_append_rows', side_effect=record):
+            history_manager.save_to_csv()
+        
+        assert held == [True, True]
+        assert not history_manager._io_lock.locked()
+    
+    def test_save_rewrites_after_clear(self, history_manager):
+        """Test clearing history makes the next save rewrite the file."""
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        history_manager.save_to_csv()
+        
+        history_manager.clear_history()
+        history_manager.add_calculation(Calculation('multiply', 2, 4, 8))
+        history_manager.save_to_csv()
+        
+        rows = self.read_rows(history_manager)
+        assert [row['operation'] for row in rows] == ['multiply']
+    
+    def test_save_compacts_file(self, history_manager):
+        """Test the file is rewritten once appends exceed the size limit."""
+        max_size = history_manager.config.max_history_size
+        for i in range(max_size):
+            history_manager.add_calculation(Calculation('add', i, 1, i + 1))
+        history_manager.save_to_csv()
+        
+        for i in range(5):
+            history_manager.add_calculation(Calculation('add', i, 2, i + 2))
+        history_manager.save_to_csv()
+        
+        rows = self.read_rows(history_manager)
+        assert len(rows) == max_size
+        assert float(rows[-1]['operand_b']) == 2
+    
+    def test_save_appends_after_load(self, history_manager):
+        """Test a loaded history file is appended to on the next save."""
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        history_manager.save_to_csv()
+        history_manager.clear_history()
+        assert history_manager.load_from_csv()
+        
+        history_manager.add_calculation(Calculation('divide', 9, 3, 3))
+        with patch.object(history_manager, '_write_columns') as mock_write:
+            history_manager.save_to_csv()
+        mock_write.assert_not_called()
+        
+        rows = self.read_rows(history_manager)
+        assert [row['operation'] for row in rows] == ['add', 'divide']
+    
+    def test_save_after_loading_empty_file(self, history_manager):
+        """Test a save after loading an empty file rewrites it with a header."""
+        history_manager.config.history_file.write_text('')
+        assert history_manager.load_from_csv()
+        
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        history_manager.save_to_csv()
+        
+        rows = self.read_rows(history_manager)
+        assert [row['operation'] for row in rows] == ['add']
+        assert history_manager.load_from_csv()
+        assert len(history_manager.get_history()) == 1
     
-    def test_load_from_csv(self):
+    def test_save_after_loading_reordered_columns(self, history_manager):
+        """Test a save after loading reordered columns rewrites the file."""
+        with open(history_manager.config.history_file, 'w') as f:
+            f.write("result,operation,operand_b,operand_a\n")
+            f.write("8,multiply,4,2\n")
+        assert history_manager.load_from_csv()
+        
+        history_manager.add_calculation(Calculation('subtract', 20, 5, 15))
+        history_manager.save_to_csv()
+        history_manager.clear_history()
+        assert history_manager.load_from_csv()
+        
+        operands = [
+            (calc.operation, calc.operand_a, calc.operand_b)
+            for calc in history_manager.get_history()
+        ]
+        assert operands == [('multiply', 2, 4), ('subtract', 20, 5)]
+    
+    def test_save_after_rewrite_races_with_add(self, history_manager):
+        """Test a calculation added during a rewrite is saved exactly once."""
+        history_manager.add_calculation(Calculation('add', 1, 1, 2))
+        history_manager.save_to_csv()
+        assert history_manager.load_from_csv()
+        history_manager.config.history_file.unlink()
+        history_manager.add_calculation(Calculation('add', 2, 1, 3))
+        
+        write_columns = history_manager._write_columns
+        
+        def write_and_add(*args):
+            write_columns(*args)
+            history_manager.add_calculation(Calculation('add', 3, 1, 4))
+        
+        with patch.object(history_manager, '_write_columns', side_effect=write_and_add):
+            history_manager.save_to_csv()
+        history_manager.save_to_csv()
+        
+        rows = self.read_rows(history_manager)
+        assert [float(row['operand_a']) for row in rows] == [1, 2, 3]
+    
+    def test_load_from_csv(self, history_manager):
         """Test loading history from CSV."""
         calc1 = Calculation('add', 5, 3, 8)
         calc2 = Calculation('subtract', 10, 4, 6)
-        self.history_manager.add_calculation(calc1)
-        self.history_manager.add_calculation(calc2)
-        self.history_manager.save_to_csv()
+        history_manager.add_calculation(calc1)
+        history_manager.add_calculation(calc2)
+        history_manager.save_to_csv()
         
         # Clear and reload
-        self.history_manager.clear_history()
-        assert self.history_manager.load_from_csv()
+        history_manager.clear_history()
+        assert history_manager.load_from_csv()
         
-        history = self.history_manager.get_history()
+        history = history_manager.get_history()
         assert len(history) == 2
         assert history[0].operation == 'add'
         assert history[1].operation == 'subtract'
     
-    def test_load_from_csv_not_exists(self):
+    @pytest.mark.parametrize("fmt", ["csv", "feather", "parquet"])
+    def test_round_trip_formats(self, fmt, monkeypatch, tmp_path):
+        """Test each history format reloads the saved calculations."""
+        if fmt != 'csv':
+            pytest.importorskip('pyarrow')
+        monkeypatch.setenv('CALCULATOR_HISTORY_FORMAT', fmt)
+        config = CalculatorConfig()
+        config.history_file = tmp_path / f'history.{fmt}'
+        manager = HistoryManager(config)
+        calcs = [
+            Calculation('add', 5, 3, 8),
+            Calculation('divide', 1, 3, 1 / 3)
+        ]
+        manager.set_history(calcs)
+        manager.save_to_csv()
+        
+        manager.clear_history()
+        assert manager.load_from_csv()
+        
+        history = manager.get_history()
+        assert [c.to_dict() for c in history] == [c.to_dict() for c in calcs]
+    
+    def test_save_with_unknown_encoding(self, history_manager, monkeypatch):
+        """Test an unknown encoding makes saving raise HistoryError."""
+        monkeypatch.setattr(
+            history_manager.config, 'default_encoding', 'no-such-encoding'
+        )
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        
+        with pytest.raises(HistoryError, match="no-such-encoding"):
+            history_manager.save_to_csv()
+        assert history_manager._needs_rewrite
+    
+    @pytest.mark.parametrize("fmt", ["feather", "parquet"])
+    def test_load_corrupt_binary_format(self, fmt, monkeypatch, tmp_path):
+        """Test an unreadable Feather or Parquet file raises HistoryError."""
+        pytest.importorskip('pyarrow')
+        monkeypatch.setenv('CALCULATOR_HISTORY_FORMAT', fmt)
+        config = CalculatorConfig()
+        config.history_file = tmp_path / f'history.{fmt}'
+        config.history_file.write_text('not a history file')
+        
+        with pytest.raises(HistoryError, match=fmt.upper()):
+            HistoryManager(config).load_from_csv()
+    
+    def test_save_uses_configured_encoding(self, tmp_path):
+        """Test a full save writes the file in the configured encoding."""
+        config = CalculatorConfig()
+        config.default_encoding = 'utf-16'
+        config.history_file = tmp_path / 'history.csv'
+        manager = HistoryManager(config)
+        manager.add_calculation(Calculation('add', 5, 3, 8))
+        manager.save_to_csv()
+        
+        with open(config.history_file, newline='', encoding='utf-16') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['operation'] for row in rows] == ['add']
+        
+        manager.clear_history()
+        assert manager.load_from_csv()
+        assert manager.get_history()[0].result == 8
+    
+    def test_load_from_csv_without_timestamp(self, history_manager):
+        """Test loading a CSV that has no timestamp column."""
+        with open(history_manager.config.history_file, 'w') as f:
+            f.write("operation,operand_a,operand_b,result\n")
+            f.write("multiply,2,4,8\n")
+        
+        assert history_manager.load_from_csv()
+        history = history_manager.get_history()
+        assert len(history) == 1
+        assert history[0].operation == 'multiply'
+        assert history[0].result == 8.0
+    
+    def test_load_from_empty_csv(self, history_manager):
+        """Test loading an empty CSV file gives empty history."""
+        history_manager.add_calculation(Calculation('add', 5, 3, 8))
+        history_manager.config.history_file.write_text('')
+        
+        assert history_manager.load_from_csv()
+        assert history_manager.get_history() == []
+    
+    def test_load_from_csv_column_order(self, history_manager):
+        """Test columns are found by header name, not position."""
+        with open(history_manager.config.history_file, 'w') as f:
+            f.write("result,operation,operand_b,operand_a\n")
+            f.write("8,multiply,4,2\n")
+        
+        assert history_manager.load_from_csv()
+        calc = history_manager.get_history()[0]
+        assert (calc.operation, calc.operand_a, calc.operand_b) == ('multiply', 2, 4)
+        assert calc.result == 8.0
+    
+    def test_load_from_csv_missing_column(self, history_manager):
+        """Test a CSV without a required column raises HistoryError."""
+        with open(history_manager.config.history_file, 'w') as f:
+            f.write("operation,operand_a,result\n")
+            f.write("add,2,4\n")
+        
+        with pytest.raises(HistoryError):
+            history_manager.load_from_csv()
+    
+    def test_load_from_csv_not_exists(self, history_manager):
         """Test loading from non-existent CSV."""
-        assert not self.history_manager.load_from_csv()
+        assert not history_manager.load_from_csv()
     
-    def test_set_history(self):
+    def test_set_history(self, history_manager):
         """Test setting history."""
         calcs = [
             Calculation('add', 1, 2, 3),
             Calculation('subtract', 5, 2, 3)
         ]
-        self.history_manager.set_history(calcs)
-        assert len(self.history_manager.get_history()) == 2
+        history_manager.set_history(calcs)
+        assert len(history_manager.get_history()) == 2
 
-    def test_save_to_csv_fail(self):
+    def test_save_to_csv_fail(self, history_manager, tmp_path):
         """Test that saving to CSV raises HistoryError on failure."""
         calc = Calculation('add', 5, 3, 8)
-        self.history_manager.add_calculation(calc)
-        with patch('pandas.DataFrame.to_csv', side_effect=IOError("Disk full")):
-            with pytest.raises(HistoryError):
-                self.history_manager.save_to_csv()
+        history_manager.add_calculation(calc)
+        # A directory is not writable as a file with either CSV backend
+        with pytest.raises(HistoryError):
+            history_manager.save_to_csv(tmp_path)
 
-    def test_load_from_csv_fail(self):
+    def test_load_from_csv_fail(self, history_manager):
         """Test that loading from CSV raises HistoryError on failure."""
-        # Create a dummy file to load
-        with open(self.config.history_file, 'w') as f:
+        # A non-numeric operand cannot be loaded
+        with open(history_manager.config.history_file, 'w') as f:
             f.write("operation,operand_a,operand_b,result,timestamp\n")
             f.write("add,invalid,3,5,2023-01-01T00:00:00\n")
         
-        with patch('app.history.Calculation.from_dict', side_effect=ValueError("Bad data")) as mock_from_dict:
-            with pytest.raises(HistoryError):
-                self.history_manager.load_from_csv()
+        with pytest.raises(HistoryError, match=r"from CSV: .*'invalid'"):
+            history_manager.load_from_csv()
@@ -1,7 +1,8 @@
 """Tests for input validation."""
 
+import functools
 import pytest
-from app.input_validators import InputValidator
+from app.input_validators import InputValidator, _parse_number
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 
@@ -9,6 +10,21 @@ from app.exceptions import ValidationError
 class TestInputValidator:
     """Tests for InputValidator class."""
     
+    @pytest.fixture(autouse=True, params=['float', 'fastnumbers'])
+    def number_parser(self, request, monkeypatch):
+        """Run each test with the builtin and the fastnumbers parser."""
+        if request.param == 'fastnumbers':
+            fastnumbers = pytest.importorskip('fastnumbers')
+            parser = functools.partial(
+                fastnumbers.fast_float, raise_on_invalid=True
+            )
+        else:
+            parser = float
+        monkeypatch.setattr('app.input_validators._to_float', parser)
+        _parse_number.cache_clear()
+        yield
+        _parse_number.cache_clear()
+    
     def setup_method(self):
         """Set up test fixtures."""
         self.config = CalculatorConfig()
@@ -31,6 +47,19 @@ class TestInputValidator:
         with pytest.raises(ValidationError):
             self.validator.validate_number('abc')
     
+    def test_validate_number_invalid_repeated(self):
+        """Test invalid input keeps raising on repeated calls."""
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                self.validator.validate_number('abc')
+    
+    def test_validate_number_uses_current_limit(self):
+        """Test cached results respect each config's maximum value."""
+        assert self.validator.validate_number('20') == 20.0
+        self.config.max_input_value = 10
+        with pytest.raises(ValidationError):
+            self.validator.validate_number('20')
+    
     def test_validate_two_numbers(self):
         """Test validating two numbers."""
         a, b = self.validator.validate_two_numbers('5', '3')
@@ -46,4 +75,20 @@ class TestInputValidator:
         """Test validating two numbers with invalid second."""
         with pytest.raises(ValidationError):
             self.validator.validate_two_numbers('5', 'xyz')
+    
+    def test_validate_numbers_bulk(self):
+        """Test validating columns of numbers."""
+        a, b = self.validator.validate_numbers_bulk(['5', 1.5], [3, '-2'])
+        assert list(a) == [5.0, 1.5]
+        assert list(b) == [3.0, -2.0]
+    
+    def test_validate_numbers_bulk_exceeds_max(self):
+        """Test bulk validation rejects values over the limit."""
+        with pytest.raises(ValidationError):
+            self.validator.validate_numbers_bulk([1, 2], [3, 1e309])
+    
+    def test_validate_numbers_bulk_invalid(self):
+        """Test bulk validation rejects non-numeric values."""
+        with pytest.raises(ValidationError):
+            self.validator.validate_numbers_bulk(['abc'], [1])
 
@@ -1,5 +1,11 @@
 """Additional integration tests."""
 
+import csv
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from app.calculator import Calculator
 from app.calculation import Calculation
@@ -8,32 +14,53 @@ from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 
 
+@pytest.fixture(scope="module")
+def calculator(tmp_path_factory):
+    """Calculator shared by this module, keeping its history in a temp dir."""
+    # History lives in a temporary directory, and auto-save is off so no
+    # AutoSaveObserver is registered: notifying observers never writes
+    # the history file.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(
+            'CALCULATOR_HISTORY_DIR', str(tmp_path_factory.mktemp('history'))
+        )
+        mp.setenv('CALCULATOR_AUTO_SAVE', 'false')
+        calculator = Calculator()
+    calculator.history_manager.clear_history()
+    return calculator
+
+
 class TestIntegration:
     """Integration tests for calculator components."""
     
-    def test_calculator_perform_calculation(self):
+    def test_calculator_perform_calculation(self, calculator):
         """Test performing a calculation through calculator."""
-        calculator = Calculator()
         result = calculator._perform_calculation('add', '5', '3')
         assert result == 8.0
     
-    def test_calculator_perform_calculation_error(self):
-        """Test calculation with error handling."""
+    def test_calculator_negative_history_size(self, monkeypatch, tmp_path):
+        """Test the calculator still runs with a negative history size."""
+        monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path))
+        monkeypatch.setenv('CALCULATOR_AUTO_SAVE', 'false')
+        monkeypatch.setenv('CALCULATOR_MAX_HISTORY_SIZE', '-1')
         calculator = Calculator()
+        
+        assert 'Result: 3.0' in calculator._process_command('add 1 2')
+    
+    def test_calculator_perform_calculation_error(self, calculator):
+        """Test calculation with error handling."""
         with pytest.raises((OperationError, ValidationError)):
             calculator._perform_calculation('divide', '5', '0')
     
-    def test_calculator_notify_observers(self):
+    def test_calculator_notify_observers(self, calculator):
         """Test observer notification."""
-        calculator = Calculator()
         calc = Calculation('add', 5, 3, 8)
         # Should not raise any exceptions
         calculator._notify_observers(calc)
+        assert not calculator.config.history_file.exists()
     
-    def test_calculator_all_commands(self):
+    def test_calculator_all_commands(self, calculator):
         """Test all calculator commands."""
-        calculator = Calculator()
-        
         # Test all operation commands
         operations = [
             'add', 'subtract', 'multiply', 'divide',
@@ -41,15 +68,51 @@ class TestIntegration:
             'percent', 'abs_diff'
         ]
         
+        args = {
+            'divide': ('10', '2'),
+            'root': ('16', '2'),
+            'modulus': ('10', '3'),
+            'percent': ('25', '100')
+        }
         for op in operations:
-            if op == 'divide':
-                result = calculator._process_command(f'{op} 10 2')
-            elif op == 'root':
-                result = calculator._process_command(f'{op} 16 2')
-            elif op == 'modulus':
-                result = calculator._process_command(f'{op} 10 3')
-            elif op == 'percent':
-                result = calculator._process_command(f'{op} 25 100')
-            else:
-                result = calculator._process_command(f'{op} 5 3')
+            a, b = args.get(op, ('5', '3'))
+            result = calculator._perform_calculation(op, a, b)
             assert result is not None
+    
+    def test_calculator_process_command(self, calculator):
+        """Test a command goes through the parser to a result."""
+        result = calculator._process_command('multiply 4 2.5')
+        assert '10.0' in result
+
+
+class TestReplSession:
+    """End-to-end tests running the REPL in a separate interpreter."""
+    
+    @pytest.mark.parametrize("session", [
+        "add 1 2\nmultiply 2 3\nexit\n",
+        "add 1 2\nmultiply 2 3\n",  # ends with EOF
+    ])
+    def test_session_end_saves_history(self, session, tmp_path):
+        """Test calculations are saved when the session ends."""
+        env = dict(
+            os.environ,
+            CALCULATOR_HISTORY_DIR=str(tmp_path / 'history'),
+            CALCULATOR_LOG_DIR=str(tmp_path / 'logs'),
+            CALCULATOR_AUTO_SAVE='true',
+            CALCULATOR_HISTORY_FORMAT='csv',
+        )
+        subprocess.run(
+            [sys.executable, '-m', 'app.calculator'],
+            input=session,
+            text=True,
+            capture_output=True,
+            env=env,
+            cwd=Path(__file__).resolve().parent.parent,
+            timeout=60,
+            check=True
+        )
+        
+        with open(tmp_path / 'history' / 'history.csv', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['operation'] for row in rows] == ['add', 'multiply']
+        assert [float(row['result']) for row in rows] == [3.0, 6.0]
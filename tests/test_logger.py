@@ -0,0 +1,94 @@
+"""Tests for logging functionality."""
+
+import logging
+import queue
+from app.logger import (
+    BufferedFileHandler,
+    CalculatorLogger,
+    DeferredQueueHandler,
+    Logger,
+    get_logger
+)
+
+
+def make_record(message: str, level: int) -> logging.LogRecord:
+    """Build a log record with the given message and level."""
+    return logging.makeLogRecord({
+        'msg': message,
+        'levelno': level,
+        'levelname': logging.getLevelName(level)
+    })
+
+
+class TestBufferedFileHandler:
+    """Tests for BufferedFileHandler class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.formatter = logging.Formatter('%(levelname)s %(message)s')
+    
+    def test_info_is_buffered_until_close(self, tmp_path):
+        """Test that info records stay buffered until the handler closes."""
+        log_file = tmp_path / 'test.log'
+        handler = BufferedFileHandler(log_file, encoding='utf-8')
+        handler.setFormatter(self.formatter)
+        
+        handler.emit(make_record('hello', logging.INFO))
+        assert log_file.read_text() == ''
+        
+        handler.close()
+        assert log_file.read_text() == 'INFO hello\n'
+    
+    def test_error_is_flushed_immediately(self, tmp_path):
+        """Test that error records are written out right away."""
+        log_file = tmp_path / 'test.log'
+        handler = BufferedFileHandler(log_file, encoding='utf-8')
+        handler.setFormatter(self.formatter)
+        
+        handler.emit(make_record('first', logging.INFO))
+        handler.emit(make_record('boom', logging.ERROR))
+        assert log_file.read_text() == 'INFO first\nERROR boom\n'
+        handler.close()
+    
+    def test_delay_opens_file_on_first_record(self, tmp_path):
+        """Test that a delayed handler creates the file only when writing."""
+        log_file = tmp_path / 'test.log'
+        handler = BufferedFileHandler(log_file, encoding='utf-8', delay=True)
+        handler.setFormatter(self.formatter)
+        assert not log_file.exists()
+        
+        handler.emit(make_record('boom', logging.ERROR))
+        assert log_file.read_text() == 'ERROR boom\n'
+        handler.close()
+
+
+class TestDeferredQueueHandler:
+    """Tests for DeferredQueueHandler class."""
+    
+    def test_enqueues_unformatted_record(self):
+        """Test that records are queued with their arguments intact."""
+        log_queue = queue.SimpleQueue()
+        handler = DeferredQueueHandler(log_queue)
+        record = logging.makeLogRecord({
+            'msg': 'Calculation: %s = %s',
+            'args': ('add', 8)
+        })
+        
+        handler.emit(record)
+        
+        queued = log_queue.get_nowait()
+        assert queued is record
+        assert queued.args == ('add', 8)
+        assert queued.getMessage() == 'Calculation: add = 8'
+
+
+class TestGetLogger:
+    """Tests for the shared logger factory."""
+    
+    def test_returns_shared_instance(self):
+        """Test that every call returns the same logger."""
+        logger = get_logger()
+        assert isinstance(logger, CalculatorLogger)
+        assert get_logger() is logger
+        assert Logger() is logger
+
@@ -1,53 +1,124 @@
 """Tests for observers."""
 
-from unittest.mock import Mock, patch
-from app.observers import LoggingObserver, AutoSaveObserver
+import threading
+import pytest
+from unittest.mock import Mock
+from app.observers import CalculatorObserver, LoggingObserver, AutoSaveObserver
 from app.calculation import Calculation
 
 
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Stub logger returned to observers created during the test."""
+    logger = Mock()
+    monkeypatch.setattr('app.observers.get_logger', lambda: logger)
+    return logger
+
+
+class TestCalculatorObserver:
+    """Tests for CalculatorObserver base class."""
+    
+    def test_on_calculation_not_implemented(self):
+        """Test the base observer must be overridden."""
+        with pytest.raises(NotImplementedError):
+            CalculatorObserver().on_calculation(Calculation('add', 5, 3, 8))
+
+
 class TestLoggingObserver:
     """Tests for LoggingObserver class."""
     
-    def test_on_calculation(self):
+    def test_on_calculation(self, mock_logger):
         """Test logging observer on calculation."""
-        with patch('app.logger.Logger') as mock_logger_class:
-            mock_logger = Mock()
-            mock_logger_class.return_value = mock_logger
-            
-            observer = LoggingObserver()
-            calc = Calculation('add', 5, 3, 8)
-            observer.on_calculation(calc)
-            
-            mock_logger.log_calculation.assert_called_once_with(
-                'add', 5, 3, 8
-            )
+        observer = LoggingObserver()
+        calc = Calculation('add', 5, 3, 8)
+        observer.on_calculation(calc)
+        
+        mock_logger.log_calculation.assert_called_once_with(
+            'add', 5, 3, 8
+        )
+    
+    def test_on_calculation_info_disabled(self, mock_logger):
+        """Test logging observer skips logging when info is disabled."""
+        mock_logger.info_enabled.return_value = False
+        
+        observer = LoggingObserver()
+        observer.on_calculation(Calculation('add', 5, 3, 8))
+        
+        mock_logger.log_calculation.assert_not_called()
+    
+    def test_no_instance_dict(self, mock_logger):
+        """Test logging observer uses slots instead of a __dict__."""
+        observer = LoggingObserver()
+        assert not hasattr(observer, '__dict__')
 
 
 class TestAutoSaveObserver:
     """Tests for AutoSaveObserver class."""
     
     def test_on_calculation(self):
-        """Test auto-save observer on calculation."""
+        """Test auto-save observer saves in the background."""
         mock_history_manager = Mock()
-        observer = AutoSaveObserver(mock_history_manager)
+        saved = threading.Event()
+        mock_history_manager.save_to_csv.side_effect = lambda: saved.set()
+        observer = AutoSaveObserver(mock_history_manager, interval=0.01)
         
         calc = Calculation('add', 5, 3, 8)
         observer.on_calculation(calc)
         
+        assert saved.wait(timeout=5)
+        observer.stop()
         mock_history_manager.save_to_csv.assert_called_once()
     
-    def test_on_calculation_save_error(self):
+    def test_on_calculation_deferred(self):
+        """Test calculations are not saved until the next flush."""
+        mock_history_manager = Mock()
+        observer = AutoSaveObserver(mock_history_manager, interval=3600)
+        
+        calc = Calculation('add', 5, 3, 8)
+        observer.on_calculation(calc)
+        observer.on_calculation(calc)
+        mock_history_manager.save_to_csv.assert_not_called()
+        
+        observer.flush()
+        mock_history_manager.save_to_csv.assert_called_once()
+        observer.stop()
+    
+    def test_flush(self):
+        """Test flushing saves only when calculations are pending."""
+        mock_history_manager = Mock()
+        observer = AutoSaveObserver(mock_history_manager, interval=3600)
+        
+        observer.flush()
+        mock_history_manager.save_to_csv.assert_not_called()
+        
+        observer.on_calculation(Calculation('add', 5, 3, 8))
+        observer.flush()
+        observer.flush()
+        mock_history_manager.save_to_csv.assert_called_once()
+        observer.stop()
+    
+    def test_stop(self):
+        """Test stopping the observer saves pending calculations."""
+        mock_history_manager = Mock()
+        observer = AutoSaveObserver(mock_history_manager, interval=3600)
+        
+        observer.on_calculation(Calculation('add', 5, 3, 8))
+        observer.stop()
+        
+        assert not observer._thread.is_alive()
+        mock_history_manager.save_to_csv.assert_called_once()
+    
+    def test_on_calculation_save_error(self, mock_logger):
         """Test auto-save observer handles save errors."""
         mock_history_manager = Mock()
         mock_history_manager.save_to_csv.side_effect = Exception("Save error")
         
-        observer = AutoSaveObserver(mock_history_manager)
+        observer = AutoSaveObserver(mock_history_manager, interval=3600)
+        calc = Calculation('add', 5, 3, 8)
+        observer.on_calculation(calc)
+        observer.stop()
         
-        with patch('app.logger.Logger') as mock_logger_class:
-            mock_logger = Mock()
-            mock_logger_class.return_value = mock_logger
-            
-            calc = Calculation('add', 5, 3, 8)
-            observer.on_calculation(calc)
-            
-            mock_logger.log_error.assert_called_once()
+        mock_logger.log_error.assert_called_once()
+        message, error = mock_logger.log_error.call_args.args
+        assert message == "Auto-save failed: %s"
+        assert str(error) == "Save error"
@@ -1,7 +1,10 @@
 """Tests for calculator operations."""
 
+import numpy as np
 import pytest
 from app.operations import (
+    OPERATIONS,
+    Operation,
     OperationFactory,
     AddOperation,
     SubtractOperation,
@@ -17,205 +20,79 @@ from app.operations import (
 )
 
 
-class TestAddOperation:
-    """Tests for addition operation."""
-    
-    def test_add_positive_numbers(self):
-        """Test adding positive numbers."""
-        op = AddOperation()
-        assert op.execute(5, 3) == 8
-    
-    def test_add_negative_numbers(self):
-        """Test adding negative numbers."""
-        op = AddOperation()
-        assert op.execute(-5, -3) == -8
-    
-    def test_add_mixed_numbers(self):
-        """Test adding positive and negative numbers."""
-        op = AddOperation()
-        assert op.execute(5, -3) == 2
-
-
-class TestSubtractOperation:
-    """Tests for subtraction operation."""
-    
-    def test_subtract_positive_numbers(self):
-        """Test subtracting positive numbers."""
-        op = SubtractOperation()
-        assert op.execute(5, 3) == 2
-    
-    def test_subtract_negative_numbers(self):
-        """Test subtracting negative numbers."""
-        op = SubtractOperation()
-        assert op.execute(-5, -3) == -2
-
-
-class TestMultiplyOperation:
-    """Tests for multiplication operation."""
-    
-    def test_multiply_positive_numbers(self):
-        """Test multiplying positive numbers."""
-        op = MultiplyOperation()
-        assert op.execute(5, 3) == 15
-    
-    def test_multiply_by_zero(self):
-        """Test multiplying by zero."""
-        op = MultiplyOperation()
-        assert op.execute(5, 0) == 0
-
-
-class TestDivideOperation:
-    """Tests for division operation."""
-    
-    def test_divide_positive_numbers(self):
-        """Test dividing positive numbers."""
-        op = DivideOperation()
-        assert op.execute(10, 2) == 5.0
-    
-    def test_divide_by_zero(self):
-        """Test dividing by zero raises error."""
-        op = DivideOperation()
-        with pytest.raises(OperationError):
-            op.execute(10, 0)
-    
-    def test_divide_decimal_result(self):
-        """Test division resulting in decimal."""
-        op = DivideOperation()
-        assert op.execute(7, 2) == 3.5
-
-
-class TestPowerOperation:
-    """Tests for power operation."""
-    
-    def test_power_positive_base_positive_exponent(self):
-        """Test power with positive base and exponent."""
-        op = PowerOperation()
-        assert op.execute(2, 3) == 8.0
-    
-    def test_power_zero_exponent(self):
-        """Test power with zero exponent."""
-        op = PowerOperation()
-        assert op.execute(5, 0) == 1.0
-    
-    def test_power_negative_exponent(self):
-        """Test power with negative exponent."""
-        op = PowerOperation()
-        assert op.execute(2, -2) == 0.25
-    
-    def test_power_zero_base(self):
-        """Test power with zero base."""
-        op = PowerOperation()
-        assert op.execute(0, 5) == 0.0
-
-
-class TestRootOperation:
-    """Tests for root operation."""
-    
-    def test_square_root(self):
-        """Test square root."""
-        op = RootOperation()
-        assert abs(op.execute(16, 2) - 4.0) < 0.001
-    
-    def test_cube_root(self):
-        """Test cube root."""
-        op = RootOperation()
-        assert abs(op.execute(27, 3) - 3.0) < 0.001
-    
-    def test_root_zero_base(self):
-        """Test root of zero."""
-        op = RootOperation()
-        assert op.execute(0, 5) == 0.0
-    
-    def test_root_zero_degree(self):
-        """Test root with zero degree raises error."""
-        op = RootOperation()
-        with pytest.raises(OperationError):
-            op.execute(16, 0)
-    
-    def test_even_root_negative_number(self):
-        """Test even root of negative number raises error."""
-        op = RootOperation()
-        with pytest.raises(OperationError):
-            op.execute(-16, 2)
-
-
-class TestModulusOperation:
-    """Tests for modulus operation."""
-    
-    def test_modulus_positive_numbers(self):
-        """Test modulus with positive numbers."""
-        op = ModulusOperation()
-        assert op.execute(10, 3) == 1.0
-    
-    def test_modulus_zero_remainder(self):
-        """Test modulus with zero remainder."""
-        op = ModulusOperation()
-        assert op.execute(10, 5) == 0.0
-    
-    def test_modulus_by_zero(self):
-        """Test modulus by zero raises error."""
-        op = ModulusOperation()
-        with pytest.raises(OperationError):
-            op.execute(10, 0)
-
-
-class TestIntDivideOperation:
-    """Tests for integer division operation."""
-    
-    def test_int_divide_positive_numbers(self):
-        """Test integer division with positive numbers."""
-        op = IntDivideOperation()
-        assert op.execute(10, 3) == 3.0
-    
-    def test_int_divide_exact_division(self):
-        """Test integer division with exact division."""
-        op = IntDivideOperation()
-        assert op.execute(10, 5) == 2.0
-    
-    def test_int_divide_by_zero(self):
-        """Test integer division by zero raises error."""
-        op = IntDivideOperation()
-        with pytest.raises(OperationError):
-            op.execute(10, 0)
-
-
-class TestPercentOperation:
-    """Tests for percentage operation."""
-    
-    def test_percent_positive_numbers(self):
-        """Test percentage calculation."""
-        op = PercentOperation()
-        assert op.execute(25, 100) == 25.0
-    
-    def test_percent_partial(self):
-        """Test percentage calculation with partial."""
-        op = PercentOperation()
-        assert op.execute(1, 4) == 25.0
-    
-    def test_percent_zero_denominator(self):
-        """Test percentage with zero denominator raises error."""
-        op = PercentOperation()
-        with pytest.raises(OperationError):
-            op.execute(25, 0)
-
-
-class TestAbsDiffOperation:
-    """Tests for absolute difference operation."""
-    
-    def test_abs_diff_positive_numbers(self):
-        """Test absolute difference with positive numbers."""
-        op = AbsDiffOperation()
-        assert op.execute(10, 5) == 5.0
-    
-    def test_abs_diff_reversed_order(self):
-        """Test absolute difference order doesn't matter."""
-        op = AbsDiffOperation()
-        assert op.execute(5, 10) == 5.0
-    
-    def test_abs_diff_negative_numbers(self):
-        """Test absolute difference with negative numbers."""
-        op = AbsDiffOperation()
-        assert op.execute(-10, -5) == 5.0
+# Operations are stateless, so the tests share one instance of each
+ADD = AddOperation()
+SUB = SubtractOperation()
+MUL = MultiplyOperation()
+DIV = DivideOperation()
+POW = PowerOperation()
+ROOT = RootOperation()
+MOD = ModulusOperation()
+INT_DIV = IntDivideOperation()
+PERCENT = PercentOperation()
+ABS_DIFF = AbsDiffOperation()
+BASE = Operation()
+
+
+# (operation, a, b, expected result)
+CASES = [
+    (ADD, 5, 3, 8),
+    (ADD, -5, -3, -8),
+    (ADD, 5, -3, 2),
+    (SUB, 5, 3, 2),
+    (SUB, -5, -3, -2),
+    (MUL, 5, 3, 15),
+    (MUL, 5, 0, 0),
+    (DIV, 10, 2, 5.0),
+    (DIV, 7, 2, 3.5),
+    (POW, 2, 3, 8.0),
+    (POW, 5, 0, 1.0),
+    (POW, 2, -2, 0.25),
+    (POW, 0, 5, 0.0),
+    (POW, -2, 3, -8.0),
+    (ROOT, 16, 2, 4.0),
+    (ROOT, 27, 3, 3.0),
+    (ROOT, 0, 5, 0.0),
+    (ROOT, -27, 3, -3.0),
+    (MOD, 10, 3, 1.0),
+    (MOD, 10, 5, 0.0),
+    (INT_DIV, 10, 3, 3.0),
+    (INT_DIV, 10, 5, 2.0),
+    (PERCENT, 25, 100, 25.0),
+    (PERCENT, 1, 4, 25.0),
+    (ABS_DIFF, 10, 5, 5.0),
+    (ABS_DIFF, 5, 10, 5.0),
+    (ABS_DIFF, -10, -5, 5.0),
+]
+
+# (operation, a, b, expected error message pattern)
+ERROR_CASES = [
+    (DIV, 10, 0, "Division by zero"),
+    (POW, -2, 0.5, "Invalid result"),
+    (POW, 10, 1000, "Error computing power"),
+    (POW, 0, -1, "Error computing power"),
+    (ROOT, 16, 0, "0th root"),
+    (ROOT, -16, 2, "even root of negative"),
+    (ROOT, 1e300, 0.01, "Error computing root"),
+    (MOD, 10, 0, "Modulus by zero"),
+    (INT_DIV, 10, 0, "Integer division by zero"),
+    (PERCENT, 25, 0, "zero denominator"),
+]
+
+
+class TestOperations:
+    """Table-driven tests for the operation classes."""
+    
+    @pytest.mark.parametrize("op,a,b,expected", CASES)
+    def test_execute(self, op, a, b, expected):
+        """Test each operation computes the expected result."""
+        assert op.execute(a, b) == pytest.approx(expected)
+    
+    @pytest.mark.parametrize("op,a,b,match", ERROR_CASES)
+    def test_execute_error(self, op, a, b, match):
+        """Test invalid inputs raise OperationError."""
+        with pytest.raises(OperationError, match=match):
+            op.execute(a, b)
 
 
 class TestOperationFactory:
@@ -243,11 +120,27 @@ class TestOperationFactory:
         with pytest.raises(OperationError):
             OperationFactory.create_operation('unknown')
     
+    def test_create_operation_returns_shared_instance(self):
+        """Test the factory hands out one cached instance per operation."""
+        op = OperationFactory.create_operation('add')
+        assert OperationFactory.create_operation('add') is op
+        assert OperationFactory.create_operation('ADD') is op
+    
     def test_create_operation_case_insensitive(self):
         """Test operation creation is case insensitive."""
         op = OperationFactory.create_operation('ADD')
         assert isinstance(op, AddOperation)
     
+    def test_execute_by_name(self):
+        """Test executing an operation by name."""
+        assert OperationFactory.execute('add', 5, 3) == 8
+        assert OperationFactory.execute('POWER', 2, 3) == 8.0
+    
+    def test_execute_unknown_operation(self):
+        """Test executing an unknown operation raises error."""
+        with pytest.raises(OperationError, match="Unknown operation"):
+            OperationFactory.execute('unknown', 1, 2)
+    
     def test_get_available_operations(self):
         """Test getting available operations."""
         ops = OperationFactory.get_available_operations()
@@ -257,12 +150,79 @@ class TestOperationFactory:
     
     def test_operation_names(self):
         """Test operation names match."""
-        assert AddOperation().get_name() == 'add'
-        assert SubtractOperation().get_name() == 'subtract'
-        assert PowerOperation().get_name() == 'power'
-        assert RootOperation().get_name() == 'root'
-        assert ModulusOperation().get_name() == 'modulus'
-        assert IntDivideOperation().get_name() == 'int_divide'
-        assert PercentOperation().get_name() == 'percent'
-        assert AbsDiffOperation().get_name() == 'abs_diff'
-
+        assert ADD.get_name() == 'add'
+        assert SUB.get_name() == 'subtract'
+        assert POW.get_name() == 'power'
+        assert ROOT.get_name() == 'root'
+        assert MOD.get_name() == 'modulus'
+        assert INT_DIV.get_name() == 'int_divide'
+        assert PERCENT.get_name() == 'percent'
+        assert ABS_DIFF.get_name() == 'abs_diff'
+    
+    def test_base_operation_not_implemented(self):
+        """Test the base Operation methods must be overridden."""
+        op = BASE
+        with pytest.raises(NotImplementedError):
+            op.execute(1, 2)
+        with pytest.raises(NotImplementedError):
+            op.get_name()
+    
+    def test_operations_have_no_instance_dict(self):
+        """Test operation instances use slots instead of a __dict__."""
+        for name in OperationFactory.get_available_operations():
+            op = OperationFactory.create_operation(name)
+            assert not hasattr(op, '__dict__')
+
+
+class TestOperationsTable:
+    """Test cases for the OPERATIONS function table."""
+    
+    def test_covers_factory_operations(self):
+        """Test every factory operation has a table entry."""
+        assert set(OPERATIONS) == set(OperationFactory.get_available_operations())
+    
+    @pytest.mark.parametrize("name,a,b", [
+        ('add', 5, 3),
+        ('divide', 10, 4),
+        ('power', 2, 10),
+        ('root', -27, 3),
+        ('modulus', -7, 3),
+        ('abs_diff', 3, 8),
+    ])
+    def test_matches_operation_classes(self, name, a, b):
+        """Test table functions agree with the operation classes."""
+        op = OperationFactory.create_operation(name)
+        assert OPERATIONS[name](a, b) == op.execute(a, b)
+    
+    def test_errors_propagate(self):
+        """Test table functions raise OperationError."""
+        with pytest.raises(OperationError):
+            OPERATIONS['divide'](1, 0)
+
+
+class TestExecuteBatch:
+    """Tests for element-wise batch execution."""
+    
+    def test_add_batch(self):
+        """Test batch addition over a large array."""
+        a = np.arange(1000)
+        result = ADD.execute_batch(a, a)
+        assert result.dtype == np.float64
+        assert (result == 2 * a).all()
+    
+    @pytest.mark.parametrize("op,a,b,expected", CASES)
+    def test_matches_execute(self, op, a, b, expected):
+        """Test batch results agree with the scalar cases."""
+        result = op.execute_batch([a, a], [b, b])
+        assert list(result) == pytest.approx([expected, expected])
+    
+    @pytest.mark.parametrize("op,a,b,match", ERROR_CASES)
+    def test_errors(self, op, a, b, match):
+        """Test any invalid element raises OperationError."""
+        with pytest.raises(OperationError, match=match):
+            op.execute_batch([1, a], [1, b])
+    
+    def test_base_batch_not_implemented(self):
+        """Test the base Operation batch method must be overridden."""
+        with pytest.raises(NotImplementedError):
+            BASE.execute_batch([1], [2])